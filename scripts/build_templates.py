@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""Precompile the email templates so reports render without parsing them."""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.generators.html_generator import compile_templates
+
+if __name__ == "__main__":
+    print(f"Compiled templates written to {compile_templates()}")
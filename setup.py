@@ -16,8 +16,7 @@ setup(
     author="Your Name",
     author_email="your.email@example.com",
     url="https://github.com/yourusername/myNewsAgent",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
+    packages=find_packages(include=["src", "src.*"]),
     python_requires=">=3.10,<3.14",
     install_requires=[
         "arxiv>=2.3.1",
@@ -25,9 +24,14 @@ setup(
         "pyyaml>=6.0.1",
         "jinja2>=3.1.3",
         "python-dotenv>=1.0.1",
+        "numpy>=1.26.0",
+        "orjson>=3.9.0",
+        "tiktoken>=0.7.0",
         "feedparser>=6.0.11",
         "requests>=2.31.0",
+        "httpx[http2]>=0.27.0",
         "beautifulsoup4>=4.12.3",
+        "lxml>=5.1.0",
         "schedule>=1.2.1",
         "python-dateutil>=2.8.2",
         "tqdm>=4.66.1",
@@ -42,7 +46,7 @@ setup(
     },
     entry_points={
         "console_scripts": [
-            "llm-digest=main:main",
+            "llm-digest=src.main:main",
         ],
     },
     classifiers=[
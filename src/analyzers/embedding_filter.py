@@ -0,0 +1,91 @@
+"""Cheap embedding-similarity gate in front of LLM relevance scoring."""
+
+import logging
+from typing import List, Tuple
+
+import numpy as np
+from ..fetchers.base import Paper
+
+logger = logging.getLogger(__name__)
+
+# Embedding endpoints accept at most 2048 inputs per request
+MAX_INPUTS_PER_REQUEST = 2048
+
+# Keep the profile well inside the embedding model's context window
+MAX_PROFILE_CHARS = 24000
+
+
+class EmbeddingFilter:
+    """Filters out papers whose abstracts are far from the research profile."""
+
+    def __init__(
+        self,
+        client,
+        model: str = "text-embedding-3-small",
+        threshold: float = 0.25
+    ):
+        """Initialize embedding filter.
+
+        Args:
+            client: OpenAI client
+            model: Embedding model name
+            threshold: Minimum cosine similarity to the research profile
+        """
+        self.client = client
+        self.model = model
+        self.threshold = threshold
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts in as few requests as possible.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            L2-normalized float32 matrix, one row per text
+        """
+        rows = []
+        for start in range(0, len(texts), MAX_INPUTS_PER_REQUEST):
+            response = self.client.embeddings.create(
+                model=self.model,
+                input=texts[start:start + MAX_INPUTS_PER_REQUEST]
+            )
+            rows.extend(item.embedding for item in response.data)
+
+        matrix = np.asarray(rows, dtype=np.float32)
+        return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+    def filter(
+        self,
+        papers: List[Paper],
+        research_profile: str
+    ) -> Tuple[List[Paper], List[Paper], np.ndarray]:
+        """Split papers by similarity to the research profile.
+
+        Args:
+            papers: Papers to filter
+            research_profile: Research profile text
+
+        Returns:
+            Tuple of (kept_papers, dropped_papers, embeddings of kept papers)
+        """
+        if not papers:
+            return [], [], np.empty((0, 0), dtype=np.float32)
+
+        texts = [research_profile[:MAX_PROFILE_CHARS]]
+        texts.extend(f"{p.title}\n{p.abstract}" for p in papers)
+
+        matrix = self.embed(texts)
+        profile_embedding, paper_embeddings = matrix[0], matrix[1:]
+        similarities = paper_embeddings @ profile_embedding
+
+        mask = similarities >= self.threshold
+        kept = [p for p, keep in zip(papers, mask) if keep]
+        dropped = [p for p, keep in zip(papers, mask) if not keep]
+
+        logger.info(
+            f"Embedding pre-filter kept {len(kept)}/{len(papers)} papers "
+            f"(threshold: {self.threshold})"
+        )
+
+        return kept, dropped, paper_embeddings[mask]
@@ -0,0 +1,128 @@
+"""Token-bucket rate limiting for LLM API calls."""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """Paces API calls against per-minute request and token budgets.
+
+    Both capacities refill continuously at ``max_* / 60`` per second, so
+    callers are throttled before the provider starts rejecting requests.
+    After a rate-limit error, ``penalize()`` halves both rates for a while.
+    """
+
+    def __init__(
+        self,
+        max_requests_per_minute: float,
+        max_tokens_per_minute: float
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            max_requests_per_minute: Request budget (RPM)
+            max_tokens_per_minute: Token budget (TPM)
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.available_request_capacity = float(max_requests_per_minute)
+        self.available_token_capacity = float(max_tokens_per_minute)
+        self.last_update_time = time.monotonic()
+        self.penalty_until = 0.0
+        self._lock = threading.Lock()
+
+    def penalize(self, duration: float = 60.0) -> None:
+        """Halve the request and token rates after a rate-limit error.
+
+        Args:
+            duration: Seconds to keep the reduced rates
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.penalty_until = now + duration
+            # Drop any burst capacity above the reduced limits
+            self.available_request_capacity = min(
+                self.available_request_capacity, self.max_requests_per_minute / 2
+            )
+            self.available_token_capacity = min(
+                self.available_token_capacity, self.max_tokens_per_minute / 2
+            )
+
+    def _rates(self, now: float):
+        """Get current (requests, tokens) per-minute limits."""
+        factor = 0.5 if now < self.penalty_until else 1.0
+        return (
+            self.max_requests_per_minute * factor,
+            self.max_tokens_per_minute * factor
+        )
+
+    def _refill(self, now: float) -> None:
+        """Add capacity accumulated since the last update."""
+        elapsed = now - self.last_update_time
+        requests_per_minute, tokens_per_minute = self._rates(now)
+        self.available_request_capacity = min(
+            self.available_request_capacity + requests_per_minute * elapsed / 60.0,
+            requests_per_minute
+        )
+        self.available_token_capacity = min(
+            self.available_token_capacity + tokens_per_minute * elapsed / 60.0,
+            tokens_per_minute
+        )
+        self.last_update_time = now
+
+    def _reserve(self, tokens: int) -> float:
+        """Consume capacity for one request if available.
+
+        Args:
+            tokens: Estimated tokens used by the request
+
+        Returns:
+            0 if capacity was consumed, otherwise seconds to wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            requests_per_minute, tokens_per_minute = self._rates(now)
+
+            # A request larger than the whole budget would never fit
+            tokens = min(tokens, tokens_per_minute)
+
+            if (self.available_request_capacity >= 1
+                    and self.available_token_capacity >= tokens):
+                self.available_request_capacity -= 1
+                self.available_token_capacity -= tokens
+                return 0.0
+
+            request_wait = (
+                (1 - self.available_request_capacity) * 60.0 / requests_per_minute
+            )
+            token_wait = (
+                (tokens - self.available_token_capacity) * 60.0 / tokens_per_minute
+            )
+            return max(request_wait, token_wait, 0.01)
+
+    async def wait_for(self, tokens: int = 0) -> None:
+        """Wait until a request of the given size may be sent.
+
+        Args:
+            tokens: Estimated tokens used by the request
+        """
+        while True:
+            wait = self._reserve(tokens)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block the calling thread until a request may be sent.
+
+        Args:
+            tokens: Estimated tokens used by the request
+        """
+        while True:
+            wait = self._reserve(tokens)
+            if not wait:
+                return
+            time.sleep(wait)
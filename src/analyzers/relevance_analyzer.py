@@ -1,9 +1,21 @@
 """Relevance analysis using LLM."""
 
+import asyncio
+import hashlib
 import logging
-from typing import List, Tuple
-from openai import OpenAI
+from itertools import islice
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import orjson
+from openai import AsyncOpenAI, RateLimitError
 from ..fetchers.base import Paper
+from ..utils.openai_client import get_openai_client
+from ..utils.tokens import count_tokens
+from .embedding_filter import EmbeddingFilter
+from .ratelimit import TokenBucket
+from .relevance_cache import RelevanceCache
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +23,16 @@ logger = logging.getLogger(__name__)
 class RelevanceAnalyzer:
     """Analyzes paper relevance using LLM."""
 
+    SYSTEM_PROMPT = (
+        "You are a research assistant that evaluates paper relevance. "
+        "Respond with a JSON object containing 'score' (0-1) and 'reason' (brief explanation)."
+    )
+    CHUNK_SYSTEM_PROMPT = (
+        "You are a research assistant that evaluates paper relevance. "
+        "Respond with a JSON object containing 'results', a list with one entry "
+        "per paper holding its 'id', 'score' (0-1) and 'reason' (brief explanation)."
+    )
+
     def __init__(self, config):
         """Initialize analyzer.
 
@@ -21,13 +43,50 @@ class RelevanceAnalyzer:
         llm_config = config.llm_config
 
         if llm_config['provider'] == 'openai':
-            self.client = OpenAI(api_key=llm_config['api_key'])
+            self.api_key = llm_config['api_key']
+            self.client = get_openai_client(self.api_key)
         else:
             raise ValueError(f"Unsupported LLM provider: {llm_config['provider']}")
 
         self.model = llm_config['model']
         self.temperature = llm_config['temperature']
         self.research_profile = config.research_profile
+        self.max_tokens = 300
+
+        # Profile section shared by every prompt, formatted once
+        self._profile_prefix = f"# Research Profile\n{self.research_profile}\n\n---\n\n"
+
+        # Concurrency and proactive rate limiting for batch analysis
+        self.max_concurrent = config.get('llm.max_concurrent', 10)
+        self.batch_size = config.get('llm.batch_size', 10)
+        self.rate_limiter = TokenBucket(
+            max_requests_per_minute=config.get('llm.max_requests_per_minute', 500),
+            max_tokens_per_minute=config.get('llm.max_tokens_per_minute', 200000)
+        )
+
+        # Persistent score cache (exact key, then embedding similarity)
+        self.profile_hash = config.profile_hash
+        self.embedding_model = config.get('llm.embedding_model', 'text-embedding-3-small')
+        self.semantic_cache = config.get('cache.relevance.semantic', True)
+
+        # Embedding pre-filter that drops clearly irrelevant papers
+        self.prefilter = None
+        if config.get('llm.prefilter', True):
+            self.prefilter = EmbeddingFilter(
+                self.client,
+                model=self.embedding_model,
+                threshold=config.get('llm.prefilter_threshold', 0.25)
+            )
+        self.cache = None
+        if config.get('cache.enabled', True) and config.get('cache.relevance.enabled', True):
+            cache_dir = Path(config.get('directories.cache', 'data/cache'))
+            self.cache = RelevanceCache(
+                cache_dir / 'relevance.db',
+                similarity_threshold=config.get('cache.relevance.similarity_threshold', 0.92),
+                max_entries=config.get('cache.relevance.max_entries', 5000),
+                model=self.model,
+                embedding_model=self.embedding_model
+            )
 
     def analyze_batch(
         self,
@@ -48,9 +107,26 @@ class RelevanceAnalyzer:
         relevant = []
         irrelevant = []
 
-        for i, paper in enumerate(papers, 1):
+        embeddings = None
+        if self.prefilter is not None and papers:
+            try:
+                papers, dropped, embeddings = self.prefilter.filter(
+                    papers, self.research_profile
+                )
+                for paper in dropped:
+                    paper.relevance_score = 0.0
+                irrelevant.extend(dropped)
+            except Exception as e:
+                logger.warning(f"Embedding pre-filter failed, scoring all papers: {e}")
+
+        results = asyncio.run(self._analyze_all(papers, embeddings))
+
+        for i, (paper, result) in enumerate(zip(papers, results), 1):
             try:
-                score, reason = self.analyze_single(paper)
+                if isinstance(result, Exception):
+                    raise result
+
+                score, reason = result
                 paper.relevance_score = score
 
                 if score >= threshold:
@@ -93,32 +169,376 @@ class RelevanceAnalyzer:
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are a research assistant that evaluates paper relevance. "
-                            "Respond with a JSON object containing 'score' (0-1) and 'reason' (brief explanation)."
-                        )
-                    },
-                    {"role": "user", "content": prompt}
-                ],
+                messages=self._build_messages(prompt),
                 temperature=self.temperature,
-                max_tokens=300,
+                max_tokens=self.max_tokens,
                 response_format={"type": "json_object"}
             )
 
-            import json
-            result = json.loads(response.choices[0].message.content)
-            score = float(result.get('score', 0.5))
-            reason = result.get('reason', 'No reason provided')
+            return self._parse_response(response.choices[0].message.content)
 
-            return score, reason
+        except Exception as e:
+            logger.error(f"LLM API error: {e}")
+            return 0.5, "Error during analysis"
+
+    def analyze_chunk(self, papers: List[Paper]) -> List[Tuple[float, str]]:
+        """Analyze relevance of several papers with a single request.
+
+        Args:
+            papers: Papers to analyze
+
+        Returns:
+            List of (relevance_score, reason) tuples, in input order
+        """
+        prompt = self._build_chunk_prompt(papers)
+
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=self._build_messages(prompt, self.CHUNK_SYSTEM_PROMPT),
+                temperature=self.temperature,
+                max_tokens=self.max_tokens * len(papers),
+                response_format={"type": "json_object"}
+            )
+
+            by_id = self._parse_chunk_response(response.choices[0].message.content)
+
+        except Exception as e:
+            logger.error(f"LLM API error: {e}")
+            by_id = {}
+
+        return [
+            by_id.get(paper.short_id, (0.5, "Error during analysis"))
+            for paper in papers
+        ]
+
+    async def analyze_single_async(
+        self,
+        paper: Paper,
+        client: Optional[AsyncOpenAI] = None
+    ) -> Tuple[float, str]:
+        """Analyze relevance of a single paper without blocking the event loop.
+
+        Args:
+            paper: Paper to analyze
+            client: Async OpenAI client (a temporary one is opened if omitted)
+
+        Returns:
+            Tuple of (relevance_score, reason)
+        """
+        try:
+            if client is None:
+                async with AsyncOpenAI(api_key=self.api_key) as client:
+                    return await self._request_score(paper, client)
+            return await self._request_score(paper, client)
 
         except Exception as e:
             logger.error(f"LLM API error: {e}")
             return 0.5, "Error during analysis"
 
+    async def _request_score(
+        self,
+        paper: Paper,
+        client: AsyncOpenAI
+    ) -> Tuple[float, str]:
+        """Score a paper with the LLM, raising on API errors.
+
+        Args:
+            paper: Paper to analyze
+            client: Async OpenAI client
+
+        Returns:
+            Tuple of (relevance_score, reason)
+        """
+        prompt = self._build_prompt(paper)
+        await self.rate_limiter.wait_for(self._estimate_tokens(prompt))
+
+        response = await self._create_completion(
+            client,
+            model=self.model,
+            messages=self._build_messages(prompt),
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            response_format={"type": "json_object"}
+        )
+
+        return self._parse_response(response.choices[0].message.content)
+
+    async def _request_chunk(
+        self,
+        papers: List[Paper],
+        client: AsyncOpenAI
+    ) -> List[Tuple[float, str]]:
+        """Score several papers with one LLM request, raising on API errors.
+
+        Papers the model leaves out of its answer are re-scored individually.
+
+        Args:
+            papers: Papers to analyze
+            client: Async OpenAI client
+
+        Returns:
+            List of (relevance_score, reason) tuples, in input order
+        """
+        if len(papers) == 1:
+            return [await self._request_score(papers[0], client)]
+
+        prompt = self._build_chunk_prompt(papers)
+        max_tokens = self.max_tokens * len(papers)
+        await self.rate_limiter.wait_for(self._estimate_tokens(prompt, max_tokens))
+
+        response = await self._create_completion(
+            client,
+            model=self.model,
+            messages=self._build_messages(prompt, self.CHUNK_SYSTEM_PROMPT),
+            temperature=self.temperature,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"}
+        )
+
+        by_id = self._parse_chunk_response(response.choices[0].message.content)
+
+        results = []
+        for paper in papers:
+            result = by_id.get(paper.short_id)
+            if result is None:
+                logger.debug(f"No batched score for {paper.short_id}, retrying alone")
+                result = await self._request_score(paper, client)
+            results.append(result)
+
+        return results
+
+    async def _create_completion(self, client: AsyncOpenAI, **kwargs):
+        """Send a chat completion, slowing the rate limiter down on 429s.
+
+        Args:
+            client: Async OpenAI client
+            **kwargs: Arguments for ``chat.completions.create``
+
+        Returns:
+            Chat completion response
+        """
+        try:
+            return await client.chat.completions.create(**kwargs)
+        except RateLimitError:
+            logger.warning("Rate limited by API, halving request rate for 60s")
+            self.rate_limiter.penalize(60.0)
+            raise
+
+    async def _lookup_cached(
+        self,
+        paper: Paper,
+        client: Optional[AsyncOpenAI] = None,
+        embedding: Optional[np.ndarray] = None
+    ) -> tuple:
+        """Look a paper up in the relevance cache.
+
+        Args:
+            paper: Paper to analyze
+            client: Async OpenAI client, used to embed the paper if needed
+            embedding: Precomputed embedding of the paper, if available
+
+        Returns:
+            Tuple of (cache_key, embedding, cached result or None)
+        """
+        key = hashlib.sha1(
+            f"{self.model}|{self.profile_hash}|{paper.short_id}".encode('utf-8')
+        ).hexdigest()
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug(f"Relevance cache hit: {paper.short_id}")
+            return key, None, cached
+
+        if embedding is None and self.semantic_cache and client is not None:
+            try:
+                embedding = await self._embed_async(paper, client)
+            except Exception as e:
+                logger.warning(f"Embedding failed, skipping semantic cache: {e}")
+
+        if embedding is not None and self.semantic_cache:
+            try:
+                cached = self.cache.get_similar(self.profile_hash, embedding)
+                if cached is not None:
+                    self.cache.put(key, self.profile_hash, *cached, embedding)
+            except Exception as e:
+                # A broken semantic tier must not stop scoring; treat as a miss
+                logger.warning(f"Semantic cache lookup failed, scoring paper: {e}")
+                cached = None
+
+        return key, embedding, cached
+
+    async def _embed_async(self, paper: Paper, client: AsyncOpenAI) -> np.ndarray:
+        """Embed a paper's title and abstract.
+
+        Args:
+            paper: Paper to embed
+            client: Async OpenAI client
+
+        Returns:
+            L2-normalized float32 embedding
+        """
+        text = f"{paper.title}\n{paper.abstract}"
+        await self.rate_limiter.wait_for(count_tokens(text, self.embedding_model))
+
+        try:
+            response = await client.embeddings.create(
+                model=self.embedding_model,
+                input=text
+            )
+        except RateLimitError:
+            self.rate_limiter.penalize(60.0)
+            raise
+
+        embedding = np.asarray(response.data[0].embedding, dtype=np.float32)
+        return embedding / np.linalg.norm(embedding)
+
+    async def _analyze_all(
+        self,
+        papers: List[Paper],
+        embeddings: Optional[np.ndarray] = None
+    ) -> list:
+        """Analyze papers concurrently, bounded by ``llm.max_concurrent``.
+
+        Cached papers are answered from the relevance cache; the rest are
+        scored in chunks of ``llm.batch_size`` papers per request.
+
+        Args:
+            papers: List of papers to analyze
+            embeddings: Precomputed paper embeddings, one row per paper
+
+        Returns:
+            List of (score, reason) tuples or exceptions, in input order
+        """
+        sem = asyncio.Semaphore(self.max_concurrent)
+        results = [None] * len(papers)
+
+        # The async client's connection pool is bound to the running event
+        # loop, so open a fresh one for every asyncio.run() call
+        async with AsyncOpenAI(api_key=self.api_key) as client:
+            lookups = [(None, None, None)] * len(papers)
+            if self.cache is not None:
+                if embeddings is None:
+                    embeddings = [None] * len(papers)
+                lookups = await asyncio.gather(
+                    *[
+                        self._bounded(sem, self._lookup_cached(p, client, e))
+                        for p, e in zip(papers, embeddings)
+                    ]
+                )
+
+            misses = []
+            for i, (_, _, cached) in enumerate(lookups):
+                if cached is not None:
+                    results[i] = cached
+                else:
+                    misses.append(i)
+
+            chunks = list(self._chunked(misses, self.batch_size))
+            chunk_results = await asyncio.gather(
+                *[
+                    self._bounded(
+                        sem, self._request_chunk([papers[i] for i in chunk], client)
+                    )
+                    for chunk in chunks
+                ],
+                return_exceptions=True
+            )
+
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            for j, i in enumerate(chunk):
+                if isinstance(chunk_result, Exception):
+                    results[i] = chunk_result
+                    continue
+
+                results[i] = chunk_result[j]
+                if self.cache is not None:
+                    key, embedding, _ = lookups[i]
+                    self.cache.put(key, self.profile_hash, *results[i], embedding)
+
+        return results
+
+    @staticmethod
+    async def _bounded(sem: asyncio.Semaphore, coro):
+        """Await a coroutine while holding the concurrency semaphore."""
+        async with sem:
+            return await coro
+
+    @staticmethod
+    def _chunked(items: list, size: int):
+        """Yield successive lists of ``size`` items."""
+        iterator = iter(items)
+        while chunk := list(islice(iterator, max(size, 1))):
+            yield chunk
+
+    def _build_messages(
+        self,
+        prompt: str,
+        system_prompt: str = SYSTEM_PROMPT
+    ) -> List[dict]:
+        """Build chat messages for a relevance prompt.
+
+        Args:
+            prompt: User prompt string
+            system_prompt: System prompt string
+
+        Returns:
+            List of chat messages
+        """
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+
+    def _parse_response(self, content: str) -> Tuple[float, str]:
+        """Parse the model's JSON response.
+
+        Args:
+            content: Raw response content
+
+        Returns:
+            Tuple of (relevance_score, reason)
+        """
+        result = orjson.loads(content)
+        score = float(result.get('score', 0.5))
+        reason = result.get('reason', 'No reason provided')
+
+        return score, reason
+
+    def _parse_chunk_response(self, content: str) -> Dict[str, Tuple[float, str]]:
+        """Parse the model's JSON response for a batched prompt.
+
+        Args:
+            content: Raw response content
+
+        Returns:
+            Dictionary mapping paper ID to (relevance_score, reason)
+        """
+        results = {}
+        for item in orjson.loads(content).get('results', []):
+            try:
+                results[str(item['id'])] = (
+                    float(item.get('score', 0.5)),
+                    item.get('reason', 'No reason provided')
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Skipping malformed batched result: {e}")
+
+        return results
+
+    def _estimate_tokens(self, prompt: str, max_tokens: Optional[int] = None) -> int:
+        """Estimate tokens consumed by a request.
+
+        Args:
+            prompt: User prompt string
+            max_tokens: Completion budget (defaults to single-paper budget)
+
+        Returns:
+            Estimated prompt + completion tokens
+        """
+        # The system prompt is small and covered by the completion budget
+        return count_tokens(prompt, self.model) + (max_tokens or self.max_tokens)
+
     def _build_prompt(self, paper: Paper) -> str:
         """Build analysis prompt.
 
@@ -128,12 +548,7 @@ class RelevanceAnalyzer:
         Returns:
             Prompt string
         """
-        return f"""# Research Profile
-{self.research_profile}
-
----
-
-# Paper to Evaluate
+        return self._profile_prefix + f"""# Paper to Evaluate
 
 **Title:** {paper.title}
 
@@ -158,4 +573,49 @@ Respond in JSON format:
   "score": 0.85,
   "reason": "This paper directly addresses..."
 }}
+"""
+
+    def _build_chunk_prompt(self, papers: List[Paper]) -> str:
+        """Build analysis prompt for several papers.
+
+        Args:
+            papers: Papers to analyze
+
+        Returns:
+            Prompt string
+        """
+        papers_json = orjson.dumps(
+            [
+                {
+                    "id": paper.short_id,
+                    "title": paper.title,
+                    "authors": paper.authors_str,
+                    "abstract": paper.abstract,
+                    "categories": paper.categories,
+                }
+                for paper in papers
+            ],
+            option=orjson.OPT_INDENT_2
+        ).decode('utf-8')
+
+        return self._profile_prefix + f"""# Papers to Evaluate
+
+{papers_json}
+
+---
+
+# Task
+
+Evaluate how relevant each paper is to my research interests (described above).
+
+For every paper provide:
+1. A relevance score from 0 to 1 (0=not relevant, 1=highly relevant)
+2. A brief reason (1-2 sentences)
+
+Respond in JSON format, with one entry per paper using its "id":
+{{
+  "results": [
+    {{"id": "2401.12345", "score": 0.85, "reason": "This paper directly addresses..."}}
+  ]
+}}
 """
@@ -0,0 +1,219 @@
+"""Persistent two-tier cache for relevance scores."""
+
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class RelevanceCache:
+    """SQLite-backed cache of relevance scores.
+
+    Lookups are tried first by exact key (model, research profile, paper ID)
+    and then by cosine similarity between abstract embeddings, so recurring
+    or cross-posted papers are not re-scored by the LLM.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        similarity_threshold: float = 0.92,
+        max_entries: int = 5000,
+        model: str = '',
+        embedding_model: str = ''
+    ):
+        """Initialize relevance cache.
+
+        Args:
+            db_path: Path to SQLite database file
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            max_entries: Maximum number of entries kept (LRU eviction)
+            model: LLM that produces the scores being cached
+            embedding_model: Model that produces the stored embeddings
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.model = model
+        self.embedding_model = embedding_model
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS relevance ("
+            "key TEXT PRIMARY KEY, "
+            "profile TEXT NOT NULL, "
+            "score REAL NOT NULL, "
+            "reason TEXT, "
+            "embedding BLOB, "
+            "last_used REAL NOT NULL, "
+            "model TEXT, "
+            "embedding_model TEXT)"
+        )
+        # Databases created before scores were tagged with their models;
+        # their untagged rows stay reachable by exact key only
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(relevance)")}
+        for column in ("model", "embedding_model"):
+            if column not in columns:
+                self.conn.execute(f"ALTER TABLE relevance ADD COLUMN {column} TEXT")
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS relevance_profile ON relevance(profile)"
+        )
+        self.conn.commit()
+
+        # Stacked, L2-normalized embeddings per (profile, dimension), loaded lazily
+        self._embeddings = {}
+
+    def get(self, key: str) -> Optional[Tuple[float, str]]:
+        """Look up a score by exact key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (score, reason) or None on miss
+        """
+        row = self.conn.execute(
+            "SELECT score, reason FROM relevance WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        self._touch(key)
+        return row[0], row[1]
+
+    def get_similar(
+        self,
+        profile: str,
+        embedding: np.ndarray
+    ) -> Optional[Tuple[float, str]]:
+        """Look up the score of the most similar cached paper.
+
+        Only papers scored by the same LLM, with embeddings from the same
+        embedding model and of the same dimension, are compared.
+
+        Args:
+            profile: Research profile hash
+            embedding: L2-normalized embedding of the paper
+
+        Returns:
+            Tuple of (score, reason) or None if nothing is similar enough
+        """
+        keys, matrix = self._load_embeddings(profile, embedding.shape[0])
+        if not keys:
+            return None
+
+        similarities = matrix @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+
+        logger.debug(
+            f"Semantic cache hit (similarity {similarities[best]:.3f})"
+        )
+        return self.get(keys[best])
+
+    def put(
+        self,
+        key: str,
+        profile: str,
+        score: float,
+        reason: str,
+        embedding: Optional[np.ndarray] = None
+    ) -> None:
+        """Store a score.
+
+        Args:
+            key: Cache key
+            profile: Research profile hash
+            score: Relevance score
+            reason: Relevance reason
+            embedding: Optional L2-normalized embedding of the paper
+        """
+        blob = embedding.astype(np.float32).tobytes() if embedding is not None else None
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO relevance "
+            "(key, profile, score, reason, embedding, last_used, model, embedding_model) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, profile, score, reason, blob, time.time(),
+             self.model, self.embedding_model)
+        )
+        self._evict()
+        self.conn.commit()
+
+        group = (profile, embedding.shape[0]) if embedding is not None else None
+        if group in self._embeddings:
+            keys, matrix = self._embeddings[group]
+            row = embedding.astype(np.float32)[np.newaxis, :]
+            self._embeddings[group] = (
+                keys + [key],
+                np.vstack([matrix, row]) if keys else row
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def _touch(self, key: str) -> None:
+        """Update the LRU timestamp of an entry."""
+        self.conn.execute(
+            "UPDATE relevance SET last_used = ? WHERE key = ?",
+            (time.time(), key)
+        )
+        self.conn.commit()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries beyond ``max_entries``."""
+        cursor = self.conn.execute(
+            "DELETE FROM relevance WHERE key IN ("
+            "SELECT key FROM relevance ORDER BY last_used DESC "
+            "LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        if cursor.rowcount > 0:
+            logger.debug(f"Evicted {cursor.rowcount} relevance cache entries")
+            # Evicted rows may still be in the in-memory matrices
+            self._embeddings.clear()
+
+    def _load_embeddings(
+        self,
+        profile: str,
+        dimension: int
+    ) -> Tuple[List[str], np.ndarray]:
+        """Load and stack cached embeddings comparable to a new one.
+
+        Args:
+            profile: Research profile hash
+            dimension: Embedding dimension
+
+        Returns:
+            Tuple of (keys, embedding matrix)
+        """
+        group = (profile, dimension)
+        if group not in self._embeddings:
+            rows = self.conn.execute(
+                "SELECT key, embedding FROM relevance "
+                "WHERE profile = ? AND model = ? AND embedding_model = ? "
+                "AND length(embedding) = ?",
+                (profile, self.model, self.embedding_model,
+                 dimension * np.dtype(np.float32).itemsize)
+            ).fetchall()
+
+            keys = [row[0] for row in rows]
+            if rows:
+                matrix = np.stack(
+                    [np.frombuffer(row[1], dtype=np.float32) for row in rows]
+                )
+            else:
+                matrix = np.empty((0, dimension), dtype=np.float32)
+
+            self._embeddings[group] = (keys, matrix)
+
+        return self._embeddings[group]
@@ -1,11 +1,37 @@
 """Configuration management for the digest agent."""
 
+import hashlib
 import os
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
+# libyaml-backed loader is much faster; fall back if PyYAML lacks it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+def _iter_flat(tree: Any, prefix: str = ""):
+    """Yield (dot_path, value) pairs for every subtree and leaf of a dict.
+
+    Args:
+        tree: Nested configuration dictionary
+        prefix: Dot path of ``tree`` itself
+
+    Yields:
+        Tuples of (dot-separated path, value)
+    """
+    if not isinstance(tree, dict):
+        return
+
+    for key, value in tree.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        yield path, value
+        yield from _iter_flat(value, path)
+
 
 class Config:
     """Configuration loader and manager."""
@@ -31,8 +57,9 @@ class Config:
                 f"Please copy config.yaml.example to config.yaml and configure it."
             )
 
+        # Assigning self.config builds the dot-path index used by get()
         with open(config_file, 'r', encoding='utf-8') as f:
-            self.config = yaml.safe_load(f)
+            self.config = yaml.load(f, Loader=_YamlLoader)
 
         # Validate configuration
         self._validate()
@@ -40,6 +67,52 @@ class Config:
         # Create necessary directories
         self._create_directories()
 
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Get the parsed configuration tree.
+
+        Returns:
+            Nested configuration dictionary
+        """
+        return self._config
+
+    @config.setter
+    def config(self, tree: Dict[str, Any]) -> None:
+        """Replace the configuration tree and rebuild the lookup index.
+
+        Args:
+            tree: Nested configuration dictionary
+        """
+        self._config = tree
+        self._reindex()
+
+    def _reindex(self):
+        """Rebuild the dot-path index and drop values derived from it."""
+        # Flattened dot-path index for O(1) lookups in get()
+        self._flat = dict(_iter_flat(self._config))
+
+        # Research profile text and SHA-256 digest, read on first access
+        self._research_profile_text: Optional[str] = None
+        self._research_profile_sha: Optional[str] = None
+
+    def set(self, key_path: str, value: Any) -> None:
+        """Set configuration value by dot-notation path.
+
+        Missing intermediate sections are created.
+
+        Args:
+            key_path: Dot-separated path (e.g., 'llm.model')
+            value: New value
+        """
+        *parents, last = key_path.split('.')
+        node = self._config
+        for key in parents:
+            if not isinstance(node.get(key), dict):
+                node[key] = {}
+            node = node[key]
+        node[last] = value
+        self._reindex()
+
     def _validate(self):
         """Validate required configuration fields."""
         required_fields = [
@@ -66,6 +139,11 @@ class Config:
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get configuration value by dot-notation path.
 
+        Lookups go through an index built when the configuration is loaded
+        or changed with ``set()`` (or by assigning ``config``). Editing the
+        nested dictionaries in place bypasses the index: an existing key
+        keeps returning its old value until one of those is used.
+
         Args:
             key_path: Dot-separated path (e.g., 'llm.model')
             default: Default value if key not found
@@ -78,8 +156,14 @@ class Config:
             >>> config.get('llm.model')
             'gpt-4o-mini'
         """
+        try:
+            return self._flat[key_path]
+        except KeyError:
+            pass
+
+        # Keys not in the index (e.g. added to self.config in place)
         keys = key_path.split('.')
-        value = self.config
+        value = self._config
 
         for key in keys:
             if isinstance(value, dict) and key in value:
@@ -114,12 +198,17 @@ class Config:
     def research_profile(self) -> str:
         """Get research profile content.
 
+        The file is read once and cached for the lifetime of the config.
+
         Returns:
             Contents of research profile markdown file
 
         Raises:
             FileNotFoundError: If profile file not found
         """
+        if self._research_profile_text is not None:
+            return self._research_profile_text
+
         profile_file = self.get('research_profile.profile_file')
         profile_path = Path(profile_file)
 
@@ -131,7 +220,26 @@ class Config:
             )
 
         with open(profile_path, 'r', encoding='utf-8') as f:
-            return f.read()
+            self._research_profile_text = f.read()
+
+        return self._research_profile_text
+
+    @property
+    def profile_hash(self) -> str:
+        """Get SHA-256 digest of the research profile.
+
+        Returns:
+            Hex digest, used to key caches on the profile content
+
+        Raises:
+            FileNotFoundError: If profile file not found
+        """
+        if self._research_profile_sha is None:
+            self._research_profile_sha = hashlib.sha256(
+                self.research_profile.encode('utf-8')
+            ).hexdigest()
+
+        return self._research_profile_sha
 
     @property
     def llm_config(self) -> Dict[str, Any]:
@@ -1,13 +1,22 @@
 """arXiv paper fetcher using official API."""
 
 import arxiv
+import feedparser
 import logging
-from datetime import datetime, timedelta
-from typing import List, Optional
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from operator import attrgetter
+from typing import Iterator, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .base import BaseFetcher, Paper
 
 logger = logging.getLogger(__name__)
 
+_get_name = attrgetter('name')
+_get_term = attrgetter('term')
+
 
 class ArxivFetcher(BaseFetcher):
     """Fetches papers from arXiv API."""
@@ -23,6 +32,27 @@ class ArxivFetcher(BaseFetcher):
         self.categories = config.get('sources.arxiv.categories', ['cs.CL'])
         self.max_results = config.get('sources.arxiv.max_results', 30)
         self.days_lookback = config.get('sources.arxiv.days_lookback', 7)
+        self.method = config.get('sources.arxiv.method', 'api')
+        self.rss_url = config.get('sources.arxiv.rss_url', 'https://rss.arxiv.org/rss/')
+        self.timeout = config.get('performance.request_timeout', 30)
+
+        # One client for all searches so its HTTP session is reused
+        self.client = arxiv.Client(
+            num_retries=config.get('performance.retry_attempts', 3)
+        )
+
+        # Pooled keep-alive connections with automatic retry/backoff for
+        # the RSS feeds (one connection per concurrent category)
+        retries = Retry(
+            total=config.get('performance.retry_attempts', 3),
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retries)
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'Mozilla/5.0 (LLM Digest Agent)'})
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
     def fetch_papers(self) -> List[Paper]:
         """Fetch recent papers from arXiv.
@@ -36,15 +66,19 @@ class ArxivFetcher(BaseFetcher):
 
         logger.info(f"Fetching papers from arXiv categories: {self.categories}")
 
-        all_papers = []
+        if not self.categories:
+            return []
+
+        if self.method == 'rss':
+            # Feeds are static files, so categories are fetched concurrently
+            with ThreadPoolExecutor(max_workers=min(8, len(self.categories))) as executor:
+                results = list(executor.map(self._fetch_category_rss, self.categories))
+        else:
+            # The API allows one request every 3 seconds over one connection;
+            # arxiv.Client enforces that delay only for sequential calls
+            results = [self._fetch_recent(category) for category in self.categories]
 
-        for category in self.categories:
-            try:
-                papers = self._fetch_category(category)
-                all_papers.extend(papers)
-                logger.info(f"Found {len(papers)} papers in {category}")
-            except Exception as e:
-                logger.error(f"Error fetching {category}: {e}", exc_info=True)
+        all_papers = [paper for papers in results for paper in papers]
 
         # Remove duplicates and filter by date
         unique_papers = self.deduplicate(all_papers)
@@ -57,14 +91,42 @@ class ArxivFetcher(BaseFetcher):
 
         return filtered_papers
 
-    def _fetch_category(self, category: str) -> List[Paper]:
-        """Fetch papers from a specific arXiv category.
+    def _fetch_recent(self, category: str) -> List[Paper]:
+        """Fetch papers of a category submitted within the lookback window.
+
+        Results arrive newest first, so iteration stops at the first paper
+        older than the cutoff and no further result pages are requested.
 
         Args:
             category: arXiv category (e.g., 'cs.CL')
 
         Returns:
-            List of Paper objects
+            List of Paper objects (empty on error)
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.days_lookback)
+        papers = []
+
+        try:
+            for paper in self._fetch_category(category):
+                if paper.published < cutoff:
+                    break
+                papers.append(paper)
+
+            logger.info(f"Found {len(papers)} papers in {category}")
+
+        except Exception as e:
+            logger.error(f"Error fetching {category}: {e}", exc_info=True)
+
+        return papers
+
+    def _fetch_category(self, category: str) -> Iterator[Paper]:
+        """Lazily fetch papers from a specific arXiv category.
+
+        Args:
+            category: arXiv category (e.g., 'cs.CL')
+
+        Yields:
+            Paper objects, most recently submitted first
         """
         # Build search query
         search = arxiv.Search(
@@ -74,19 +136,102 @@ class ArxivFetcher(BaseFetcher):
             sort_order=arxiv.SortOrder.Descending
         )
 
+        # Result pages are requested only as iteration reaches them
+        for result in self.client.results(search):
+            paper = self._convert_result(result)
+            if paper:
+                yield paper
+
+    def _fetch_category_rss(self, category: str) -> List[Paper]:
+        """Fetch the latest announcements of a category from the arXiv RSS feed.
+
+        One request returns the whole listing, avoiding the API's paginated,
+        rate-limited search. The feed only covers the most recent
+        announcement day, so it suits daily digests.
+
+        Args:
+            category: arXiv category (e.g., 'cs.CL')
+
+        Returns:
+            List of Paper objects (empty on error)
+        """
         papers = []
 
         try:
-            for result in search.results():
-                paper = self._convert_result(result)
+            response = self.session.get(
+                f"{self.rss_url.rstrip('/')}/{category}",
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+
+            feed = feedparser.parse(response.content)
+
+            for entry in feed.entries:
+                # Skip revisions of older papers
+                if entry.get('arxiv_announce_type', 'new').startswith('replace'):
+                    continue
+
+                paper = self._convert_entry(entry, category)
                 if paper:
                     papers.append(paper)
+                if len(papers) >= self.max_results:
+                    break
+
+            logger.info(f"Found {len(papers)} papers in {category} (RSS)")
 
         except Exception as e:
-            logger.error(f"Error processing arXiv results: {e}", exc_info=True)
+            logger.error(f"Error fetching {category} RSS feed: {e}", exc_info=True)
 
         return papers
 
+    def _convert_entry(self, entry, category: str) -> Optional[Paper]:
+        """Convert an arXiv RSS entry to Paper object.
+
+        Args:
+            entry: feedparser entry
+            category: Category the feed was fetched for
+
+        Returns:
+            Paper object or None if conversion fails
+        """
+        try:
+            # Entry IDs look like 'oai:arXiv.org:2401.12345v1'
+            arxiv_id = entry.id.rsplit(':', 1)[-1].rsplit('/', 1)[-1]
+
+            # Descriptions start with 'arXiv:<id> Announce Type: new Abstract: ...'
+            abstract = entry.get('summary', '').split('Abstract:', 1)[-1].strip()
+
+            # dc:creator holds all authors as one comma-separated string
+            authors = [
+                name.strip()
+                for author in entry.get('authors', [])
+                for name in author.get('name', '').split(',')
+                if name.strip()
+            ]
+
+            if entry.get('published_parsed'):
+                published = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+            else:
+                published = datetime.now(timezone.utc)
+
+            categories = list(map(_get_term, entry.get('tags', []))) or [category]
+
+            return Paper(
+                title=entry.title.strip(),
+                authors=authors,
+                abstract=abstract,
+                pdf_url=f"https://arxiv.org/pdf/{arxiv_id}",
+                arxiv_id=arxiv_id,
+                published=published,
+                categories=categories,
+                primary_category=categories[0],
+                source="arxiv"
+            )
+
+        except Exception as e:
+            logger.warning(f"Error converting arXiv RSS entry: {e}")
+            return None
+
     def _convert_result(self, result: arxiv.Result) -> Optional[Paper]:
         """Convert arXiv Result to Paper object.
 
@@ -102,7 +247,7 @@ class ArxivFetcher(BaseFetcher):
 
             paper = Paper(
                 title=result.title.strip(),
-                authors=[author.name for author in result.authors],
+                authors=list(map(_get_name, result.authors)),
                 abstract=result.summary.strip(),
                 pdf_url=result.pdf_url,
                 arxiv_id=arxiv_id,
@@ -133,7 +278,7 @@ class ArxivFetcher(BaseFetcher):
         papers = []
 
         try:
-            for result in search.results():
+            for result in self.client.results(search):
                 paper = self._convert_result(result)
                 if paper:
                     papers.append(paper)
@@ -164,7 +309,7 @@ class ArxivFetcher(BaseFetcher):
         papers = []
 
         try:
-            for result in search.results():
+            for result in self.client.results(search):
                 paper = self._convert_result(result)
                 if paper:
                     papers.append(paper)
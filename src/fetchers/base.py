@@ -1,13 +1,16 @@
 """Base classes for paper fetchers."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
+# Score shown for papers that were never scored
+DEFAULT_DISPLAY_SCORE = 0.5
 
-@dataclass
+
+@dataclass(slots=True)
 class Paper:
     """Represents a research paper with metadata and summaries."""
 
@@ -32,22 +35,54 @@ class Paper:
     fetched_at: datetime = field(default_factory=datetime.now)
     processed: bool = False
 
+    # Derived values, computed once in __post_init__
+    _short_id: str = field(default='', init=False, repr=False, compare=False)
+    _authors_str: str = field(default='', init=False, repr=False, compare=False)
+    _arxiv_url: str = field(default='', init=False, repr=False, compare=False)
+    _published_str: str = field(default='', init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute derived values used on hot paths."""
+        # Remove version suffix like 'v1', 'v2'
+        self._short_id = self.arxiv_id.split('v', 1)[0]
+        self._arxiv_url = f"https://arxiv.org/abs/{self._short_id}"
+        self._published_str = self.published.strftime("%b %d, %Y")
+
+        if len(self.authors) == 0:
+            self._authors_str = "Unknown"
+        elif len(self.authors) == 1:
+            self._authors_str = self.authors[0]
+        elif len(self.authors) == 2:
+            self._authors_str = f"{self.authors[0]} and {self.authors[1]}"
+        else:
+            self._authors_str = f"{self.authors[0]} et al."
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert paper to dictionary.
 
         Returns:
-            Dictionary representation
+            Dictionary representation (lists and dicts are shared, not copied)
         """
-        data = asdict(self)
-        # Convert datetime objects to ISO format strings
-        data['published'] = self.published.isoformat()
-        data['fetched_at'] = self.fetched_at.isoformat()
-        # Convert Path objects to strings
-        if self.pdf_path:
-            data['pdf_path'] = str(self.pdf_path)
-        if self.markdown_path:
-            data['markdown_path'] = str(self.markdown_path)
-        return data
+        # Built by hand: asdict() would deep-copy every list and dict field
+        return {
+            'title': self.title,
+            'authors': self.authors,
+            'abstract': self.abstract,
+            'pdf_url': self.pdf_url,
+            'arxiv_id': self.arxiv_id,
+            # Convert datetime objects to ISO format strings
+            'published': self.published.isoformat(),
+            'categories': self.categories,
+            'primary_category': self.primary_category,
+            'source': self.source,
+            'relevance_score': self.relevance_score,
+            'summary': self.summary,
+            # Convert Path objects to strings
+            'pdf_path': str(self.pdf_path) if self.pdf_path else None,
+            'markdown_path': str(self.markdown_path) if self.markdown_path else None,
+            'fetched_at': self.fetched_at.isoformat(),
+            'processed': self.processed,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Paper':
@@ -80,8 +115,49 @@ class Paper:
         Returns:
             Short ID (e.g., '2401.12345')
         """
-        # Remove version suffix like 'v1', 'v2'
-        return self.arxiv_id.split('v')[0] if 'v' in self.arxiv_id else self.arxiv_id
+        return self._short_id
+
+    @property
+    def arxiv_url(self) -> str:
+        """Get arXiv abstract page URL.
+
+        Returns:
+            URL (e.g., 'https://arxiv.org/abs/2401.12345')
+        """
+        return self._arxiv_url
+
+    @property
+    def display_category(self) -> str:
+        """Get the category shown in reports.
+
+        Returns:
+            Primary category, falling back to the first listed category
+        """
+        return self.primary_category or (self.categories[0] if self.categories else '')
+
+    @property
+    def relevance_bucket(self) -> str:
+        """Get relevance level for styling.
+
+        Returns:
+            'high', 'medium' or 'low'
+        """
+        # Derived on access: relevance_score is assigned after construction
+        score = self.relevance_score or DEFAULT_DISPLAY_SCORE
+        if score >= 0.8:
+            return 'high'
+        if score >= 0.5:
+            return 'medium'
+        return 'low'
+
+    @property
+    def relevance_percent(self) -> int:
+        """Get relevance score as a whole percentage.
+
+        Returns:
+            Percentage (e.g., 85)
+        """
+        return int((self.relevance_score or DEFAULT_DISPLAY_SCORE) * 100)
 
     @property
     def authors_str(self) -> str:
@@ -90,14 +166,7 @@ class Paper:
         Returns:
             Comma-separated author names
         """
-        if len(self.authors) == 0:
-            return "Unknown"
-        elif len(self.authors) == 1:
-            return self.authors[0]
-        elif len(self.authors) == 2:
-            return f"{self.authors[0]} and {self.authors[1]}"
-        else:
-            return f"{self.authors[0]} et al."
+        return self._authors_str
 
     @property
     def published_str(self) -> str:
@@ -106,7 +175,7 @@ class Paper:
         Returns:
             Date string (e.g., 'Jan 15, 2024')
         """
-        return self.published.strftime("%b %d, %Y")
+        return self._published_str
 
     def __repr__(self) -> str:
         """String representation."""
@@ -152,8 +221,14 @@ class BaseFetcher(ABC):
         """
         from datetime import timedelta
 
-        cutoff_date = datetime.now() - timedelta(days=days_lookback)
-        return [p for p in papers if p.published >= cutoff_date]
+        # arXiv dates are timezone-aware, other sources may be naive
+        cutoff_naive = datetime.now() - timedelta(days=days_lookback)
+        cutoff_aware = cutoff_naive.astimezone()
+
+        return [
+            p for p in papers
+            if p.published >= (cutoff_aware if p.published.tzinfo else cutoff_naive)
+        ]
 
     def deduplicate(self, papers: List[Paper]) -> List[Paper]:
         """Remove duplicate papers by arxiv_id.
@@ -162,14 +237,10 @@ class BaseFetcher(ABC):
             papers: List of papers
 
         Returns:
-            Deduplicated list
+            Deduplicated list (first occurrence wins, order preserved)
         """
-        seen = set()
-        unique_papers = []
-
+        unique = {}
         for paper in papers:
-            if paper.short_id not in seen:
-                seen.add(paper.short_id)
-                unique_papers.append(paper)
+            unique.setdefault(paper.short_id, paper)
 
-        return unique_papers
+        return list(unique.values())
@@ -1,10 +1,13 @@
 """HuggingFace Daily Papers fetcher."""
 
+import hashlib
 import requests
 import logging
 from datetime import datetime
 from typing import List
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .base import BaseFetcher, Paper
 
 logger = logging.getLogger(__name__)
@@ -28,6 +31,18 @@ class HuggingFaceFetcher(BaseFetcher):
         self.max_results = config.get('sources.huggingface.max_results', 15)
         self.timeout = config.get('performance.request_timeout', 30)
 
+        # Pooled keep-alive connections with automatic retry/backoff
+        retries = Retry(
+            total=config.get('performance.retry_attempts', 3),
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retries)
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'Mozilla/5.0 (LLM Digest Agent)'})
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def fetch_papers(self) -> List[Paper]:
         """Fetch trending papers from HuggingFace.
 
@@ -41,11 +56,7 @@ class HuggingFaceFetcher(BaseFetcher):
         logger.info("Fetching papers from HuggingFace Daily Papers")
 
         try:
-            response = requests.get(
-                self.base_url,
-                timeout=self.timeout,
-                headers={'User-Agent': 'Mozilla/5.0 (LLM Digest Agent)'}
-            )
+            response = self.session.get(self.base_url, timeout=self.timeout)
             response.raise_for_status()
 
             papers = self._parse_html(response.text)
@@ -73,18 +84,18 @@ class HuggingFaceFetcher(BaseFetcher):
             This is a basic parser. HuggingFace's HTML structure may change,
             requiring updates to this method. Consider using their API if available.
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # lxml is a C parser, several times faster than 'html.parser'
+        soup = BeautifulSoup(html_content, 'lxml')
         papers = []
 
         # Find paper cards (structure may vary)
         # This is a simplified parser - adjust selectors based on actual HTML
-        article_elements = soup.find_all('article', limit=self.max_results)
+        article_elements = soup.select('article', limit=self.max_results)
 
         if not article_elements:
             # Try alternative structure
-            article_elements = soup.find_all(
-                'div',
-                class_=lambda x: x and 'paper' in x.lower(),
+            article_elements = soup.select(
+                'div[class*="paper" i]',
                 limit=self.max_results
             )
 
@@ -132,8 +143,10 @@ class HuggingFaceFetcher(BaseFetcher):
 
         if not arxiv_id:
             logger.debug(f"No arXiv ID found for paper: {title}")
-            # Generate a temporary ID
-            arxiv_id = f"hf_{hash(title) % 1000000}"
+            # Generate a stable ID; hash() is salted per process
+            arxiv_id = "hf_" + hashlib.blake2b(
+                title.encode('utf-8'), digest_size=8
+            ).hexdigest()
 
         # Try to extract abstract (may not always be available)
         abstract_elem = elem.find('p')
@@ -1,17 +1,122 @@
 """HTML email report generation."""
 
+import functools
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import List
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+    TemplateNotFound,
+    select_autoescape,
+)
 from ..fetchers.base import Paper
 
 logger = logging.getLogger(__name__)
 
+TEMPLATE_DIR = Path(__file__).parent.parent.parent / 'templates'
+
+# Precompiled templates built by scripts/build_templates.py
+COMPILED_TEMPLATES = 'compiled.zip'
+
+
+def _add_filters(env: Environment) -> None:
+    """Register the custom filters used by the templates.
+
+    Args:
+        env: Jinja2 environment
+    """
+    env.filters['format_date'] = HTMLGenerator._format_date
+    env.filters['truncate_text'] = HTMLGenerator._truncate_text
+
+
+def _compiled_is_current(template_dir: Path) -> bool:
+    """Check whether the precompiled bundle is newer than every template.
+
+    Args:
+        template_dir: Directory containing the templates
+
+    Returns:
+        True if the bundle exists and no template changed after it was built
+    """
+    bundle = template_dir / COMPILED_TEMPLATES
+    if not bundle.exists():
+        return False
+
+    built_at = bundle.stat().st_mtime
+    return all(t.stat().st_mtime <= built_at for t in template_dir.glob('*.html'))
+
+
+@functools.lru_cache(maxsize=4)
+def _get_env(template_dir: str, bytecode_dir: str) -> Environment:
+    """Get the Jinja2 environment shared by all generators in this process.
+
+    Uses the precompiled bundle when it is up to date, so templates are
+    never parsed, and otherwise the template sources with a bytecode cache.
+
+    Args:
+        template_dir: Directory containing the templates
+        bytecode_dir: Directory for compiled template bytecode
+
+    Returns:
+        Jinja2 environment
+    """
+    if _compiled_is_current(Path(template_dir)):
+        logger.debug(f"Using precompiled templates from {template_dir}")
+        env = Environment(
+            loader=ModuleLoader(str(Path(template_dir) / COMPILED_TEMPLATES)),
+            autoescape=select_autoescape(['html', 'xml']),
+            auto_reload=False,
+            cache_size=400
+        )
+    else:
+        env = Environment(
+            loader=FileSystemLoader(template_dir),
+            autoescape=select_autoescape(['html', 'xml']),
+            bytecode_cache=FileSystemBytecodeCache(bytecode_dir, '%s.cache'),
+            auto_reload=False,
+            cache_size=400
+        )
+
+    _add_filters(env)
+    return env
+
+
+def compile_templates(template_dir: Path = TEMPLATE_DIR) -> Path:
+    """Compile all templates into a bundle loaded by ``ModuleLoader``.
+
+    Args:
+        template_dir: Directory containing the templates
+
+    Returns:
+        Path to the compiled bundle
+    """
+    env = Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        autoescape=select_autoescape(['html', 'xml'])
+    )
+    _add_filters(env)
+
+    target = template_dir / COMPILED_TEMPLATES
+    env.compile_templates(
+        str(target),
+        filter_func=lambda name: name.endswith('.html'),
+        zip='deflated',
+        ignore_errors=False
+    )
+    return target
+
 
 class HTMLGenerator:
-    """Generates HTML email reports."""
+    """Generates HTML email reports.
+
+    The template is resolved once in ``__init__`` and compiled bytecode is
+    persisted under the cache directory, so an instance can be kept around
+    and reused for any number of reports.
+    """
 
     def __init__(self, config):
         """Initialize HTML generator.
@@ -24,16 +129,20 @@ class HTMLGenerator:
         self.reports_dir = Path(config.get('directories.reports', 'outputs/reports'))
         self.reports_dir.mkdir(parents=True, exist_ok=True)
 
-        # Setup Jinja2 environment
-        template_dir = Path(__file__).parent.parent.parent / 'templates'
-        self.env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=select_autoescape(['html', 'xml'])
-        )
+        # Compiled templates are reused across runs
+        bytecode_dir = Path(config.get('directories.cache', 'data/cache')) / 'jinja'
+        bytecode_dir.mkdir(parents=True, exist_ok=True)
+
+        # Shared environment, so compiled templates are reused in-process too
+        self.env = _get_env(str(TEMPLATE_DIR), str(bytecode_dir))
 
-        # Add custom filters
-        self.env.filters['format_date'] = self._format_date
-        self.env.filters['truncate_text'] = self._truncate_text
+        # Resolve the template once
+        template_file = f"email_{self.template_name}.html"
+        try:
+            self._template = self.env.get_template(template_file)
+        except TemplateNotFound:
+            logger.error(f"Template not found: {template_file}, using 'modern'")
+            self._template = self.env.get_template("email_modern.html")
 
     def generate_report(
         self,
@@ -57,22 +166,14 @@ class HTMLGenerator:
         # Prepare template data
         template_data = self._prepare_template_data(papers, date_range)
 
-        # Render template
-        template_file = f"email_{self.template_name}.html"
-        try:
-            template = self.env.get_template(template_file)
-        except Exception as e:
-            logger.error(f"Template not found: {template_file}, using 'modern'")
-            template = self.env.get_template("email_modern.html")
-
-        html_content = template.render(**template_data)
-
-        # Save report
+        # Render straight to disk without building the whole page in memory
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = self.reports_dir / f"digest_{timestamp}.html"
 
+        stream = self._template.stream(**template_data)
+        stream.enable_buffering(16)
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            stream.dump(f)
 
         logger.info(f"Report saved to: {output_file}")
         return output_file
@@ -92,33 +193,14 @@ class HTMLGenerator:
             Dictionary with template data
         """
         # Count highly relevant papers (score >= 0.8)
-        relevant_count = sum(
-            1 for p in papers
-            if p.relevance_score and p.relevance_score >= 0.8
-        )
-
-        # Prepare paper data for template
-        papers_data = []
-        for paper in papers:
-            paper_dict = {
-                'title': paper.title,
-                'authors': paper.authors_str,
-                'abstract': paper.abstract,
-                'arxiv_url': f"https://arxiv.org/abs/{paper.short_id}",
-                'pdf_url': paper.pdf_url,
-                'arxiv_id': paper.arxiv_id,
-                'date': paper.published_str,
-                'category': paper.primary_category or paper.categories[0],
-                'relevance_score': paper.relevance_score or 0.5,
-                'summary': paper.summary
-            }
-            papers_data.append(paper_dict)
+        relevant_count = sum(1 for p in papers if p.relevance_bucket == 'high')
 
         return {
             'date_range': date_range,
             'total_papers': len(papers),
             'relevant_papers': relevant_count,
-            'papers': papers_data,
+            # Templates read fields straight from the Paper objects
+            'papers': papers,
             'generation_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
 
@@ -131,16 +213,20 @@ class HTMLGenerator:
         Returns:
             Date range string
         """
-        if not papers:
-            return datetime.now().strftime("%b %d, %Y")
-
-        dates = [p.published for p in papers if p.published]
-        if not dates:
+        # Track both bounds in a single pass
+        min_date = max_date = None
+        for paper in papers:
+            published = paper.published
+            if not published:
+                continue
+            if min_date is None or published < min_date:
+                min_date = published
+            if max_date is None or published > max_date:
+                max_date = published
+
+        if min_date is None:
             return datetime.now().strftime("%b %d, %Y")
 
-        min_date = min(dates)
-        max_date = max(dates)
-
         if min_date.date() == max_date.date():
             return min_date.strftime("%b %d, %Y")
         else:
@@ -1,5 +1,6 @@
 """RIS format exporter for Zotero import."""
 
+import io
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -54,65 +55,62 @@ class RISExporter:
         Returns:
             RIS format string
         """
-        ris_entries = []
+        buf = io.StringIO()
 
-        for paper in papers:
-            entry = self._paper_to_ris(paper)
-            ris_entries.append(entry)
+        for i, paper in enumerate(papers):
+            if i:
+                buf.write("\n\n")
+            self._write_paper_ris(buf, paper)
 
-        return "\n\n".join(ris_entries)
+        return buf.getvalue()
 
-    def _paper_to_ris(self, paper: Paper) -> str:
-        """Convert a single paper to RIS format.
+    def _write_paper_ris(self, buf: io.StringIO, paper: Paper) -> None:
+        """Write a single paper in RIS format.
 
         Args:
+            buf: Buffer to write to
             paper: Paper object
-
-        Returns:
-            RIS format string for the paper
         """
-        lines = [
-            "TY  - JOUR",  # Journal Article
-            f"TI  - {paper.title}",
-        ]
+        write = buf.write
+
+        write("TY  - JOUR\n")  # Journal Article
+        write(f"TI  - {paper.title}\n")
 
         # Authors
         for author in paper.authors:
-            lines.append(f"AU  - {author}")
+            write(f"AU  - {author}\n")
 
         # Abstract
         if paper.abstract:
-            lines.append(f"AB  - {paper.abstract}")
+            write(f"AB  - {paper.abstract}\n")
 
         # Publication date
         if paper.published:
-            lines.append(f"PY  - {paper.published.year}")
-            lines.append(f"DA  - {paper.published.strftime('%Y/%m/%d')}")
+            write(f"PY  - {paper.published.year}\n")
+            write(f"DA  - {paper.published.strftime('%Y/%m/%d')}\n")
 
         # arXiv ID and URL
-        lines.append(f"ID  - {paper.arxiv_id}")
-        lines.append(f"UR  - https://arxiv.org/abs/{paper.short_id}")
+        write(f"ID  - {paper.arxiv_id}\n")
+        write(f"UR  - {paper.arxiv_url}\n")
 
         # PDF URL
         if paper.pdf_url:
-            lines.append(f"L1  - {paper.pdf_url}")
+            write(f"L1  - {paper.pdf_url}\n")
 
         # Keywords from categories
         for category in paper.categories:
-            lines.append(f"KW  - {category}")
+            write(f"KW  - {category}\n")
 
         # Notes (relevance score and summary if available)
         if paper.relevance_score:
-            lines.append(f"N1  - Relevance Score: {paper.relevance_score:.2f}")
+            write(f"N1  - Relevance Score: {paper.relevance_score:.2f}\n")
 
         if paper.summary:
             summary_text = self._format_summary_for_notes(paper.summary)
-            lines.append(f"N1  - {summary_text}")
+            write(f"N1  - {summary_text}\n")
 
         # End of record
-        lines.append("ER  - ")
-
-        return "\n".join(lines)
+        write("ER  - ")
 
     def _format_summary_for_notes(self, summary: dict) -> str:
         """Format summary dictionary for RIS notes field.
@@ -1,20 +1,11 @@
 """Main entry point for LLM News Digest Agent."""
 
+import asyncio
 import sys
 import logging
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config import Config
 from src.utils.logger import setup_logger
-from src.fetchers import ArxivFetcher, HuggingFaceFetcher
-from src.analyzers import RelevanceAnalyzer
-from src.processors import PDFProcessor
-from src.summarizers import LLMSummarizer
-from src.generators import HTMLGenerator, RISExporter
-from src.notifiers import EmailSender
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +34,10 @@ def main():
         logger.info("Starting LLM News Digest Agent")
         logger.info("=" * 60)
 
+        # Pipeline stages are imported as they are reached, so configuration
+        # errors and empty fetches don't pay for openai, numpy, jinja2, etc.
+        from src.fetchers import ArxivFetcher, HuggingFaceFetcher
+
         # Step 1: Fetch papers
         print("\n📚 Step 1/7: Fetching papers from sources...")
         all_papers = []
@@ -69,6 +64,7 @@ def main():
 
         # Step 2: Analyze relevance
         print("\n🔍 Step 2/7: Analyzing paper relevance...")
+        from src.analyzers import RelevanceAnalyzer
         analyzer = RelevanceAnalyzer(config)
         threshold = config.get('processing.relevance_threshold', 0.7)
         relevant_papers, _ = analyzer.analyze_batch(all_papers, threshold=threshold)
@@ -79,37 +75,55 @@ def main():
             print("⚠️  No relevant papers found!")
             return
 
-        # Step 3: Download PDFs
-        print("\n📥 Step 3/7: Downloading PDFs...")
-        processor = PDFProcessor(config)
-
         # Limit downloads based on config
         max_to_process = config.get('processing.max_papers_to_process', 10)
         papers_to_download = relevant_papers[:max_to_process]
 
-        if len(relevant_papers) > max_to_process:
-            print(f"  ℹ️  Limiting to top {max_to_process} most relevant papers")
+        if config.get('performance.async_pipeline', False):
+            from src import pipeline_async
 
-        downloaded_papers = processor.download_batch(papers_to_download)
-        print(f"  ✓ Downloaded {len(downloaded_papers)} PDFs")
+            # Steps 3-5 overlap: each paper moves on as soon as it is ready
+            print("\n⚡ Steps 3-5/7: Downloading, converting and summarizing...")
+            if len(relevant_papers) > max_to_process:
+                print(f"  ℹ️  Limiting to top {max_to_process} most relevant papers")
 
-        # Step 4: Convert to Markdown
-        if config.get('processing.pdf_to_markdown.enabled', True):
-            print("\n📝 Step 4/7: Converting PDFs to Markdown...")
-            converted_papers = processor.convert_batch(downloaded_papers)
+            downloaded_papers, converted_papers, summarized_papers = asyncio.run(
+                pipeline_async.run(config, papers_to_download)
+            )
+            print(f"  ✓ Downloaded {len(downloaded_papers)} PDFs")
             print(f"  ✓ Converted {len(converted_papers)} papers")
+            print(f"  ✓ Generated {len(summarized_papers)} summaries")
         else:
-            print("\n⏭️  Step 4/7: Skipping PDF conversion (disabled in config)")
-            converted_papers = downloaded_papers
-
-        # Step 5: Generate summaries
-        print("\n🧠 Step 5/7: Generating detailed summaries with LLM...")
-        summarizer = LLMSummarizer(config)
-        summarized_papers = summarizer.summarize_batch(converted_papers)
-        print(f"  ✓ Generated {len(summarized_papers)} summaries")
+            # Step 3: Download PDFs
+            print("\n📥 Step 3/7: Downloading PDFs...")
+            from src.processors import PDFProcessor
+            processor = PDFProcessor(config)
+
+            if len(relevant_papers) > max_to_process:
+                print(f"  ℹ️  Limiting to top {max_to_process} most relevant papers")
+
+            downloaded_papers = processor.download_batch(papers_to_download)
+            print(f"  ✓ Downloaded {len(downloaded_papers)} PDFs")
+
+            # Step 4: Convert to Markdown
+            if config.get('processing.pdf_to_markdown.enabled', True):
+                print("\n📝 Step 4/7: Converting PDFs to Markdown...")
+                converted_papers = processor.convert_batch(downloaded_papers)
+                print(f"  ✓ Converted {len(converted_papers)} papers")
+            else:
+                print("\n⏭️  Step 4/7: Skipping PDF conversion (disabled in config)")
+                converted_papers = downloaded_papers
+
+            # Step 5: Generate summaries
+            print("\n🧠 Step 5/7: Generating detailed summaries with LLM...")
+            from src.summarizers import LLMSummarizer
+            summarizer = LLMSummarizer(config)
+            summarized_papers = summarizer.summarize_batch(converted_papers)
+            print(f"  ✓ Generated {len(summarized_papers)} summaries")
 
         # Step 6: Generate reports
         print("\n📊 Step 6/7: Generating reports...")
+        from src.generators import HTMLGenerator, RISExporter
 
         # HTML report
         html_gen = HTMLGenerator(config)
@@ -125,6 +139,7 @@ def main():
 
         # Step 7: Send email
         print("\n📧 Step 7/7: Sending email...")
+        from src.notifiers import EmailSender
         sender = EmailSender(config)
         success = sender.send_report(html_file, ris_file)
 
@@ -0,0 +1,85 @@
+"""Pipelined download, conversion and summarization on one event loop."""
+
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+from openai import AsyncOpenAI
+from .fetchers.base import Paper
+from .processors import PDFProcessor
+from .summarizers import LLMSummarizer
+
+logger = logging.getLogger(__name__)
+
+
+async def run(
+    config,
+    papers: List[Paper]
+) -> Tuple[List[Paper], List[Paper], List[Paper]]:
+    """Download, convert and summarize papers as a pipeline.
+
+    Each paper moves on to conversion as soon as its own PDF is on disk and
+    to summarization as soon as its markdown is ready, instead of waiting
+    for the whole batch to finish each step. Every step keeps its own
+    concurrency limit.
+
+    Args:
+        config: Configuration object
+        papers: Relevant papers to process
+
+    Returns:
+        Tuple of (downloaded, converted, summarized) papers, in input order
+    """
+    processor = PDFProcessor(config)
+    summarizer = LLMSummarizer(config)
+    convert_enabled = config.get('processing.pdf_to_markdown.enabled', True)
+
+    download_slots = asyncio.Semaphore(processor.max_workers)
+    convert_slots = asyncio.Semaphore(processor.convert_workers)
+    summary_slots = asyncio.Semaphore(summarizer.max_workers)
+
+    downloaded, converted, summarized = [], [], []
+
+    async with processor.async_client() as http, \
+            AsyncOpenAI(api_key=summarizer.api_key) as aclient:
+
+        async def process(paper: Paper) -> Optional[Paper]:
+            async with download_slots:
+                if await processor.download_paper_async(paper, http) is None:
+                    return None
+            downloaded.append(paper)
+
+            if convert_enabled:
+                async with convert_slots:
+                    if await processor.convert_to_markdown_async(paper) is None:
+                        return None
+            converted.append(paper)
+
+            async with summary_slots:
+                paper.summary = await summarizer.summarize_single_async(paper, aclient)
+                paper.processed = True
+            summarized.append(paper)
+
+            return paper
+
+        results = await asyncio.gather(
+            *(process(paper) for paper in papers),
+            return_exceptions=True
+        )
+
+    for paper, result in zip(papers, results):
+        if isinstance(result, Exception):
+            logger.error(f"Processing failed for {paper.arxiv_id}: {result}")
+
+    # Completion order is arbitrary; report papers in input (relevance) order
+    order = {id(paper): i for i, paper in enumerate(papers)}
+
+    def in_order(items: List[Paper]) -> List[Paper]:
+        return sorted(items, key=lambda p: order[id(p)])
+
+    logger.info(
+        f"Pipeline processed {len(papers)} papers: {len(downloaded)} downloaded, "
+        f"{len(converted)} converted, {len(summarized)} summarized"
+    )
+
+    return in_order(downloaded), in_order(converted), in_order(summarized)
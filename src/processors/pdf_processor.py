@@ -1,20 +1,45 @@
 """PDF download and conversion to Markdown using MinerU."""
 
+import asyncio
 import logging
+import os
 import requests
+import shutil
 import subprocess
+import tempfile
+import threading
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import orjson
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 from ..fetchers.base import Paper
 
 logger = logging.getLogger(__name__)
 
 
+def _load_mineru_api():
+    """Import MinerU's in-process parser, if this MinerU version has one.
+
+    Returns:
+        Tuple of (do_parse, read_fn) or None to fall back to the CLI
+    """
+    try:
+        from mineru.cli.common import do_parse, read_fn
+    except ImportError:
+        return None
+
+    return do_parse, read_fn
+
+
 class PDFProcessor:
     """Downloads and converts PDFs to Markdown."""
 
+    # Seconds allowed for one MinerU conversion
+    MINERU_TIMEOUT = 120
+
     def __init__(self, config):
         """Initialize PDF processor.
 
@@ -29,7 +54,40 @@ class PDFProcessor:
 
         self.timeout = config.get('performance.request_timeout', 30)
         self.max_workers = config.get('performance.parallel_downloads', 5)
+        self.revalidate_pdfs = config.get('performance.revalidate_pdfs', False)
         self.mineru_enabled = config.get('processing.pdf_to_markdown.enabled', True)
+        self.parse_method = config.get('processing.pdf_to_markdown.method', 'auto')
+        self.parse_tables = config.get('processing.pdf_to_markdown.parse_tables', True)
+
+        # Calling MinerU in-process loads its models once instead of paying
+        # the Python/PyTorch start-up for every paper. The models are shared,
+        # so in-process conversions run one at a time.
+        self.mineru_api = _load_mineru_api() if self.mineru_enabled else None
+        self._mineru_lock = threading.Lock()
+        if self.mineru_api is not None:
+            logger.debug("Using in-process MinerU")
+
+        # Each MinerU job keeps roughly one core busy in its own subprocess
+        self.convert_workers = config.get(
+            'performance.parallel_conversions',
+            max(1, (os.cpu_count() or 2) // 2)
+        )
+
+        # One pooled session shared by all download threads
+        retries = Retry(
+            total=config.get('performance.retry_attempts', 3),
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers,
+            max_retries=retries
+        )
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'Mozilla/5.0 (LLM Digest Agent)'})
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
     def download_paper(self, paper: Paper) -> Optional[Path]:
         """Download a single paper PDF.
@@ -43,31 +101,155 @@ class PDFProcessor:
         filename = f"{paper.short_id.replace('/', '_')}.pdf"
         filepath = self.papers_dir / filename
 
-        # Skip if already exists
-        if filepath.exists():
-            logger.debug(f"PDF already exists: {filename}")
+        # Skip if already downloaded, or revalidate with a conditional GET
+        use_cached, headers = self._check_cached_pdf(filepath)
+        if use_cached:
             paper.pdf_path = filepath
             return filepath
 
+        # Write to a temp file so a partial download is never mistaken
+        # for a finished PDF by the exists() check above
+        tmp_path = filepath.with_suffix('.pdf.tmp')
+
         try:
             logger.info(f"Downloading: {paper.title[:50]}...")
 
-            response = requests.get(
-                paper.pdf_url,
-                timeout=self.timeout,
-                headers={'User-Agent': 'Mozilla/5.0 (LLM Digest Agent)'}
-            )
-            response.raise_for_status()
+            with self.session.get(
+                paper.pdf_url, timeout=self.timeout, stream=True, headers=headers
+            ) as response:
+                if response.status_code == 304:
+                    logger.debug(f"PDF unchanged: {filename}")
+                    paper.pdf_path = filepath
+                    return filepath
 
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+                response.raise_for_status()
+
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=1 << 16):
+                        f.write(chunk)
+
+            self._finish_download(tmp_path, filepath, response.headers)
 
             logger.info(f"Downloaded: {filename}")
             paper.pdf_path = filepath
             return filepath
 
         except Exception as e:
-            logger.error(f"Error downloading {paper.arxiv_id}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return self._download_failed(paper, filepath, headers, e)
+
+    def _check_cached_pdf(self, filepath: Path) -> Tuple[bool, Dict[str, str]]:
+        """Decide whether a previously downloaded PDF can be used as is.
+
+        A sidecar ``.pdf.meta.json`` records the size and HTTP validators
+        of every download. Files whose size disagrees with it are fetched
+        again; with ``performance.revalidate_pdfs`` the others are checked
+        with a conditional GET.
+
+        Args:
+            filepath: Local PDF path
+
+        Returns:
+            Tuple of (use cached file, extra request headers)
+        """
+        if not filepath.exists():
+            return False, {}
+
+        meta = self._read_meta(filepath)
+
+        if meta and meta.get('size') not in (None, filepath.stat().st_size):
+            logger.warning(f"Size mismatch for {filepath.name}, downloading again")
+            return False, {}
+
+        if self.revalidate_pdfs and meta:
+            headers = {}
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+            if headers:
+                return False, headers
+
+        logger.debug(f"PDF already exists: {filepath.name}")
+        return True, {}
+
+    def _finish_download(self, tmp_path: Path, filepath: Path, headers) -> None:
+        """Verify a completed download and move it into place.
+
+        Args:
+            tmp_path: Temporary file holding the response body
+            filepath: Final PDF path
+            headers: Response headers
+
+        Raises:
+            IOError: If fewer bytes arrived than Content-Length announced
+        """
+        size = tmp_path.stat().st_size
+        expected = headers.get('Content-Length')
+        encoded = headers.get('Content-Encoding', 'identity') != 'identity'
+        if expected is not None and not encoded and int(expected) != size:
+            raise IOError(f"Incomplete download: {size} of {expected} bytes")
+
+        os.replace(tmp_path, filepath)
+
+        meta = {
+            'size': size,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+        }
+        try:
+            self._meta_path(filepath).write_bytes(orjson.dumps(meta))
+        except OSError as e:
+            logger.warning(f"Error writing download metadata: {e}")
+
+    @staticmethod
+    def _download_failed(
+        paper: Paper,
+        filepath: Path,
+        headers: Dict[str, str],
+        error: Exception
+    ) -> Optional[Path]:
+        """Handle a failed download or revalidation.
+
+        Args:
+            paper: Paper object
+            filepath: Local PDF path
+            headers: Conditional headers sent, if any
+            error: Raised exception
+
+        Returns:
+            The existing PDF if only revalidation failed, otherwise None
+        """
+        if headers and filepath.exists():
+            logger.warning(f"Could not revalidate {filepath.name}, using cached copy: {error}")
+            paper.pdf_path = filepath
+            return filepath
+
+        logger.error(f"Error downloading {paper.arxiv_id}: {error}")
+        return None
+
+    @staticmethod
+    def _meta_path(filepath: Path) -> Path:
+        """Get the download metadata sidecar path for a PDF."""
+        return filepath.with_suffix('.pdf.meta.json')
+
+    def _read_meta(self, filepath: Path) -> Optional[Dict[str, Any]]:
+        """Read download metadata for a PDF.
+
+        Args:
+            filepath: Local PDF path
+
+        Returns:
+            Metadata dictionary or None if missing or unreadable
+        """
+        meta_path = self._meta_path(filepath)
+        if not meta_path.exists():
+            return None
+
+        try:
+            return orjson.loads(meta_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Error reading download metadata: {e}")
             return None
 
     def download_batch(self, papers: List[Paper]) -> List[Paper]:
@@ -114,51 +296,26 @@ class PDFProcessor:
         Returns:
             Path to markdown file or None if failed
         """
-        if not self.mineru_enabled:
-            logger.debug("MinerU conversion disabled")
-            return None
-
-        if not paper.pdf_path or not paper.pdf_path.exists():
-            logger.warning(f"PDF not found for {paper.arxiv_id}")
-            return None
-
-        markdown_file = self.markdown_dir / f"{paper.short_id}.md"
-
-        # Skip if already converted
-        if markdown_file.exists():
-            logger.debug(f"Markdown already exists: {markdown_file.name}")
-            paper.markdown_path = markdown_file
+        markdown_file = self._conversion_target(paper)
+        if markdown_file is None or markdown_file.exists():
             return markdown_file
 
         try:
             logger.info(f"Converting to markdown: {paper.title[:50]}...")
 
-            # Run MinerU command
-            # Note: MinerU syntax may vary, adjust as needed
-            cmd = [
-                "mineru",
-                "pdf",
-                str(paper.pdf_path),
-                "-o", str(markdown_file)
-            ]
+            if self.mineru_api is not None:
+                return self._convert_in_process(paper, markdown_file)
 
             result = subprocess.run(
-                cmd,
+                self._mineru_command(paper, markdown_file),
                 capture_output=True,
                 text=True,
-                timeout=120  # 2 minutes timeout
+                timeout=self.MINERU_TIMEOUT
             )
 
-            if result.returncode == 0 and markdown_file.exists():
-                logger.info(f"Converted: {markdown_file.name}")
-                paper.markdown_path = markdown_file
-                return markdown_file
-            else:
-                logger.error(
-                    f"MinerU conversion failed for {paper.arxiv_id}: "
-                    f"{result.stderr}"
-                )
-                return None
+            return self._finish_conversion(
+                paper, markdown_file, result.returncode, result.stderr
+            )
 
         except subprocess.TimeoutExpired:
             logger.error(f"MinerU timeout for {paper.arxiv_id}")
@@ -174,7 +331,7 @@ class PDFProcessor:
             return None
 
     def convert_batch(self, papers: List[Paper]) -> List[Paper]:
-        """Convert multiple papers to markdown.
+        """Convert multiple papers to markdown in parallel.
 
         Args:
             papers: List of papers with PDFs downloaded
@@ -186,17 +343,263 @@ class PDFProcessor:
 
         successful = []
 
-        for paper in tqdm(papers, desc="Converting to Markdown"):
-            try:
-                result = self.convert_to_markdown(paper)
-                if result:
-                    successful.append(paper)
-            except Exception as e:
-                logger.error(f"Conversion failed for {paper.arxiv_id}: {e}")
+        # Threads suffice: the heavy lifting happens in MinerU subprocesses
+        with ThreadPoolExecutor(max_workers=self.convert_workers) as executor:
+            future_to_paper = {
+                executor.submit(self.convert_to_markdown, paper): paper
+                for paper in papers
+            }
+
+            for future in tqdm(
+                as_completed(future_to_paper),
+                total=len(papers),
+                desc="Converting to Markdown"
+            ):
+                paper = future_to_paper[future]
+                try:
+                    result = future.result()
+                    if result:
+                        successful.append(paper)
+                except Exception as e:
+                    logger.error(f"Conversion failed for {paper.arxiv_id}: {e}")
 
         logger.info(f"Successfully converted {len(successful)}/{len(papers)} papers")
         return successful
 
+    def _conversion_target(self, paper: Paper) -> Optional[Path]:
+        """Check whether a paper can be converted and where to.
+
+        Papers that were already converted get ``markdown_path`` set, and
+        callers skip them when the returned file exists.
+
+        Args:
+            paper: Paper object with pdf_path set
+
+        Returns:
+            Path to markdown file or None if the paper cannot be converted
+        """
+        if not self.mineru_enabled:
+            logger.debug("MinerU conversion disabled")
+            return None
+
+        if not paper.pdf_path or not paper.pdf_path.exists():
+            logger.warning(f"PDF not found for {paper.arxiv_id}")
+            return None
+
+        markdown_file = self.markdown_dir / f"{paper.short_id}.md"
+
+        # Skip if already converted
+        if markdown_file.exists():
+            logger.debug(f"Markdown already exists: {markdown_file.name}")
+            paper.markdown_path = markdown_file
+
+        return markdown_file
+
+    @staticmethod
+    def _mineru_command(paper: Paper, markdown_file: Path) -> List[str]:
+        """Build the MinerU command line.
+
+        Args:
+            paper: Paper object with pdf_path set
+            markdown_file: Output markdown path
+
+        Returns:
+            Command arguments
+        """
+        # Note: MinerU syntax may vary, adjust as needed
+        return [
+            "mineru",
+            "pdf",
+            str(paper.pdf_path),
+            "-o", str(markdown_file)
+        ]
+
+    def _convert_in_process(self, paper: Paper, markdown_file: Path) -> Optional[Path]:
+        """Convert a PDF with MinerU's Python API.
+
+        Args:
+            paper: Paper object with pdf_path set
+            markdown_file: Output markdown path
+
+        Returns:
+            Path to markdown file or None if failed
+        """
+        do_parse, read_fn = self.mineru_api
+        name = markdown_file.stem
+
+        # MinerU writes <out>/<name>/<method>/<name>.md plus side files
+        with tempfile.TemporaryDirectory(dir=self.markdown_dir) as out_dir:
+            with self._mineru_lock:
+                do_parse(
+                    out_dir,
+                    [name],
+                    [read_fn(paper.pdf_path)],
+                    ['en'],
+                    parse_method=self.parse_method,
+                    table_enable=self.parse_tables,
+                    f_draw_layout_bbox=False,
+                    f_draw_span_bbox=False,
+                    f_dump_middle_json=False,
+                    f_dump_model_output=False,
+                    f_dump_orig_pdf=False,
+                    f_dump_content_list=False
+                )
+
+            produced = next(Path(out_dir).rglob(f"{name}.md"), None)
+            if produced is not None:
+                shutil.move(str(produced), str(markdown_file))
+
+        return self._finish_conversion(
+            paper, markdown_file, 0 if produced else 1, "MinerU produced no markdown"
+        )
+
+    @staticmethod
+    def _finish_conversion(
+        paper: Paper,
+        markdown_file: Path,
+        returncode: int,
+        stderr: str
+    ) -> Optional[Path]:
+        """Record the outcome of a MinerU run.
+
+        Args:
+            paper: Paper object
+            markdown_file: Expected markdown path
+            returncode: MinerU exit status
+            stderr: MinerU error output
+
+        Returns:
+            Path to markdown file or None if failed
+        """
+        if returncode == 0 and markdown_file.exists():
+            logger.info(f"Converted: {markdown_file.name}")
+            paper.markdown_path = markdown_file
+            return markdown_file
+
+        logger.error(f"MinerU conversion failed for {paper.arxiv_id}: {stderr}")
+        return None
+
+    def async_client(self):
+        """Create an HTTP/2 client for ``download_paper_async``.
+
+        Returns:
+            httpx.AsyncClient sized to ``parallel_downloads``
+        """
+        import httpx
+
+        # Pool settings belong on the transport: an explicit transport
+        # makes the client ignore its own http2/limits arguments
+        return httpx.AsyncClient(
+            follow_redirects=True,
+            headers={'User-Agent': 'Mozilla/5.0 (LLM Digest Agent)'},
+            timeout=self.timeout,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=self.config.get('performance.retry_attempts', 3),
+                limits=httpx.Limits(
+                    max_connections=self.max_workers,
+                    max_keepalive_connections=self.max_workers
+                )
+            )
+        )
+
+    async def download_paper_async(self, paper: Paper, client) -> Optional[Path]:
+        """Download a single paper PDF without blocking the event loop.
+
+        Args:
+            paper: Paper object
+            client: httpx.AsyncClient from ``async_client``
+
+        Returns:
+            Path to downloaded PDF or None if failed
+        """
+        filename = f"{paper.short_id.replace('/', '_')}.pdf"
+        filepath = self.papers_dir / filename
+
+        use_cached, headers = self._check_cached_pdf(filepath)
+        if use_cached:
+            paper.pdf_path = filepath
+            return filepath
+
+        tmp_path = filepath.with_suffix('.pdf.tmp')
+
+        try:
+            logger.info(f"Downloading: {paper.title[:50]}...")
+
+            async with client.stream('GET', paper.pdf_url, headers=headers) as response:
+                if response.status_code == 304:
+                    logger.debug(f"PDF unchanged: {filename}")
+                    paper.pdf_path = filepath
+                    return filepath
+
+                response.raise_for_status()
+
+                with open(tmp_path, 'wb') as f:
+                    async for chunk in response.aiter_bytes(1 << 16):
+                        f.write(chunk)
+
+            self._finish_download(tmp_path, filepath, response.headers)
+
+            logger.info(f"Downloaded: {filename}")
+            paper.pdf_path = filepath
+            return filepath
+
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            return self._download_failed(paper, filepath, headers, e)
+
+    async def convert_to_markdown_async(self, paper: Paper) -> Optional[Path]:
+        """Convert PDF to Markdown without blocking the event loop.
+
+        Args:
+            paper: Paper object with pdf_path set
+
+        Returns:
+            Path to markdown file or None if failed
+        """
+        markdown_file = self._conversion_target(paper)
+        if markdown_file is None or markdown_file.exists():
+            return markdown_file
+
+        try:
+            logger.info(f"Converting to markdown: {paper.title[:50]}...")
+
+            if self.mineru_api is not None:
+                return await asyncio.to_thread(
+                    self._convert_in_process, paper, markdown_file
+                )
+
+            process = await asyncio.create_subprocess_exec(
+                *self._mineru_command(paper, markdown_file),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+
+            try:
+                _, stderr = await asyncio.wait_for(
+                    process.communicate(), timeout=self.MINERU_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                logger.error(f"MinerU timeout for {paper.arxiv_id}")
+                return None
+
+            return self._finish_conversion(
+                paper, markdown_file, process.returncode,
+                stderr.decode('utf-8', errors='replace')
+            )
+
+        except FileNotFoundError:
+            logger.error(
+                "MinerU not found. Please install: pip install mineru\n"
+                "Or disable PDF conversion in config.yaml"
+            )
+            return None
+        except Exception as e:
+            logger.error(f"Error converting {paper.arxiv_id}: {e}")
+            return None
+
     def read_markdown(self, paper: Paper) -> Optional[str]:
         """Read converted markdown content.
 
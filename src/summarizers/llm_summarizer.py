@@ -1,13 +1,25 @@
 """LLM-based paper summarization."""
 
+import hashlib
 import logging
-import json
-from typing import Dict, Any, List
-from openai import OpenAI
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import orjson
+from openai import RateLimitError
+from tqdm import tqdm
+from ..analyzers.ratelimit import TokenBucket
 from ..fetchers.base import Paper
+from ..utils.openai_client import get_openai_client
+from ..utils.tokens import count_tokens, truncate_tokens
 
 logger = logging.getLogger(__name__)
 
+# Tokens reserved for the research profile and instructions around the paper
+PROMPT_OVERHEAD = 2000
+
 
 class LLMSummarizer:
     """Generates detailed paper summaries using LLM."""
@@ -22,7 +34,8 @@ class LLMSummarizer:
         llm_config = config.llm_config
 
         if llm_config['provider'] == 'openai':
-            self.client = OpenAI(api_key=llm_config['api_key'])
+            self.api_key = llm_config['api_key']
+            self.client = get_openai_client(self.api_key)
         else:
             raise ValueError(f"Unsupported LLM provider: {llm_config['provider']}")
 
@@ -31,6 +44,36 @@ class LLMSummarizer:
         self.max_tokens = llm_config['max_tokens']
         self.research_profile = config.research_profile
 
+        # Paper text budget: a cost cap (~20k characters by default) that
+        # never exceeds what fits next to the prompt and the completion
+        context_tokens = config.get('llm.max_context_tokens', 128000)
+        self.max_content_tokens = min(
+            config.get('llm.max_content_tokens', 5000),
+            context_tokens - self.max_tokens - PROMPT_OVERHEAD
+        )
+
+        # Summaries are network-bound, so run several at once within rate limits
+        self.max_workers = config.get('performance.parallel_summaries', 5)
+        self.batch_size = config.get('llm.summary_batch_size', 4)
+        self.rate_limiter = TokenBucket(
+            max_requests_per_minute=config.get('llm.max_requests_per_minute', 500),
+            max_tokens_per_minute=config.get('llm.max_tokens_per_minute', 200000)
+        )
+
+        # Disk cache of summaries keyed by model settings and prompt. With
+        # temperature > 0 a cached summary is one sample of many, so that
+        # case can be switched off separately.
+        self.cache_dir = None
+        cache_enabled = (
+            config.get('cache.enabled', True)
+            and config.get('cache.summaries.enabled', True)
+        )
+        if self.temperature > 0 and not config.get('cache.summaries.cache_sampled', True):
+            cache_enabled = False
+        if cache_enabled:
+            self.cache_dir = Path(config.get('directories.llm_cache', 'data/llm_cache'))
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
     def summarize_batch(self, papers: List[Paper]) -> List[Paper]:
         """Generate summaries for multiple papers.
 
@@ -42,16 +85,42 @@ class LLMSummarizer:
         """
         logger.info(f"Generating summaries for {len(papers)} papers...")
 
-        for i, paper in enumerate(papers, 1):
-            try:
-                logger.info(f"[{i}/{len(papers)}] Summarizing: {paper.title[:50]}...")
-                summary = self.summarize_single(paper)
-                paper.summary = summary
-                paper.processed = True
-
-            except Exception as e:
-                logger.error(f"Error summarizing {paper.arxiv_id}: {e}")
-                paper.summary = self._create_fallback_summary(paper)
+        # Abstract-only papers are short enough to share one request; papers
+        # with full markdown content are summarized one at a time
+        full_text = []
+        abstract_only = []
+        for paper in papers:
+            if paper.markdown_path and paper.markdown_path.exists():
+                full_text.append(paper)
+            else:
+                abstract_only.append(paper)
+
+        chunks = [[paper] for paper in full_text]
+        chunks.extend(
+            abstract_only[start:start + self.batch_size]
+            for start in range(0, len(abstract_only), self.batch_size)
+        )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            future_to_chunk = {
+                executor.submit(self.summarize_chunk, chunk): chunk
+                for chunk in chunks
+            }
+
+            with tqdm(total=len(papers), desc="Summarizing papers") as progress:
+                for future in as_completed(future_to_chunk):
+                    chunk = future_to_chunk[future]
+                    try:
+                        for paper, summary in zip(chunk, future.result()):
+                            paper.summary = summary
+                            paper.processed = True
+
+                    except Exception as e:
+                        for paper in chunk:
+                            logger.error(f"Error summarizing {paper.arxiv_id}: {e}")
+                            paper.summary = self._create_fallback_summary(paper)
+
+                    progress.update(len(chunk))
 
         logger.info("All summaries generated")
         return papers
@@ -65,44 +134,238 @@ class LLMSummarizer:
         Returns:
             Summary dictionary
         """
+        prompt, cache_path, cached = self._prepare(paper)
+        if cached is not None:
+            return cached
+
+        try:
+            self.rate_limiter.acquire(count_tokens(prompt, self.model) + self.max_tokens)
+            response = self.client.chat.completions.create(**self._request_args(prompt))
+
+            summary = orjson.loads(response.choices[0].message.content)
+            self._write_cached(cache_path, summary)
+            return summary
+
+        except RateLimitError as e:
+            logger.error(f"LLM API rate limited: {e}")
+            self.rate_limiter.penalize(60.0)
+            return self._create_fallback_summary(paper)
+
+        except Exception as e:
+            logger.error(f"LLM API error: {e}")
+            return self._create_fallback_summary(paper)
+
+    def summarize_chunk(self, papers: List[Paper]) -> List[Dict[str, Any]]:
+        """Generate summaries for several abstract-only papers in one request.
+
+        Cached papers are not sent again. Papers the model leaves out of its
+        answer, or all of them if the batched request fails, are summarized
+        individually.
+
+        Summaries from the batched request are cached as batch results,
+        separately from single-prompt summaries: a later single-paper call
+        never gets a batch answer, while batches accept either kind.
+
+        Args:
+            papers: Papers without markdown content
+
+        Returns:
+            List of summary dictionaries, in input order
+        """
+        if len(papers) == 1:
+            return [self.summarize_single(papers[0])]
+
+        results = [None] * len(papers)
+        pending = []
+        for i, paper in enumerate(papers):
+            prompt, _, cached = self._prepare(paper)
+            batch_path = self._get_cache_path(prompt, batched=True)
+            if cached is None:
+                cached = self._read_cached(batch_path)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append((i, paper, batch_path))
+
+        by_id = {}
+        if len(pending) > 1:
+            prompt = self._build_batch_prompt([paper for _, paper, _ in pending])
+            max_tokens = self.max_tokens * len(pending)
+
+            try:
+                self.rate_limiter.acquire(count_tokens(prompt, self.model) + max_tokens)
+                response = self.client.chat.completions.create(
+                    **self._request_args(prompt, max_tokens)
+                )
+                by_id = self._parse_batch_response(response.choices[0].message.content)
+
+            except RateLimitError as e:
+                logger.error(f"LLM API rate limited: {e}")
+                self.rate_limiter.penalize(60.0)
+
+            except Exception as e:
+                logger.warning(f"Batched summary failed, summarizing individually: {e}")
+
+        for i, paper, batch_path in pending:
+            summary = by_id.get(paper.short_id)
+            if summary is None:
+                summary = self.summarize_single(paper)
+            else:
+                self._write_cached(batch_path, summary)
+            results[i] = summary
+
+        return results
+
+    async def summarize_single_async(self, paper: Paper, aclient) -> Dict[str, Any]:
+        """Generate detailed summary for a single paper without blocking.
+
+        Args:
+            paper: Paper object
+            aclient: AsyncOpenAI client
+
+        Returns:
+            Summary dictionary
+        """
+        prompt, cache_path, cached = self._prepare(paper)
+        if cached is not None:
+            return cached
+
+        try:
+            await self.rate_limiter.wait_for(
+                count_tokens(prompt, self.model) + self.max_tokens
+            )
+            response = await aclient.chat.completions.create(**self._request_args(prompt))
+
+            summary = orjson.loads(response.choices[0].message.content)
+            self._write_cached(cache_path, summary)
+            return summary
+
+        except RateLimitError as e:
+            logger.error(f"LLM API rate limited: {e}")
+            self.rate_limiter.penalize(60.0)
+            return self._create_fallback_summary(paper)
+
+        except Exception as e:
+            logger.error(f"LLM API error: {e}")
+            return self._create_fallback_summary(paper)
+
+    def _prepare(self, paper: Paper) -> tuple:
+        """Build the prompt for a paper and look it up in the cache.
+
+        Args:
+            paper: Paper object
+
+        Returns:
+            Tuple of (prompt, cache_path, cached summary or None)
+        """
         # Use markdown content if available, otherwise use abstract
         content = paper.abstract
         if paper.markdown_path and paper.markdown_path.exists():
             try:
                 with open(paper.markdown_path, 'r', encoding='utf-8') as f:
                     content = f.read()
-                    # Limit length to avoid token limits
-                    if len(content) > 20000:
-                        content = content[:20000] + "\n\n[Content truncated...]"
+                # Limit length to avoid token limits
+                content, truncated = truncate_tokens(
+                    content, self.model, self.max_content_tokens
+                )
+                if truncated:
+                    content += "\n\n[Content truncated...]"
             except Exception as e:
                 logger.warning(f"Error reading markdown, using abstract: {e}")
 
         prompt = self._build_summary_prompt(paper, content)
 
+        cache_path = self._get_cache_path(prompt)
+        cached = self._read_cached(cache_path)
+        if cached is not None:
+            logger.debug(f"Summary cache hit: {paper.short_id}")
+        else:
+            logger.debug(f"Summarizing: {paper.title[:50]}...")
+
+        return prompt, cache_path, cached
+
+    def _request_args(self, prompt: str, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """Build chat completion arguments for a prompt.
+
+        Args:
+            prompt: Summarization prompt
+            max_tokens: Completion budget (defaults to single-paper budget)
+
+        Returns:
+            Keyword arguments for ``chat.completions.create``
+        """
+        return {
+            'model': self.model,
+            'messages': [
+                {
+                    "role": "system",
+                    "content": (
+                        "You are an expert research assistant specializing in LLM and AI research. "
+                        "Provide detailed, insightful paper summaries in JSON format."
+                    )
+                },
+                {"role": "user", "content": prompt}
+            ],
+            'temperature': self.temperature,
+            'max_tokens': max_tokens or self.max_tokens,
+            'response_format': {"type": "json_object"}
+        }
+
+    def _get_cache_path(self, prompt: str, batched: bool = False) -> Optional[Path]:
+        """Get summary cache file path for a prompt.
+
+        Args:
+            prompt: Single-paper summarization prompt
+            batched: Key the summary the batched request produced for this
+                paper instead of the single-prompt answer
+
+        Returns:
+            Path to cache file, or None if caching is disabled
+        """
+        if self.cache_dir is None:
+            return None
+
+        material = f"{self.model}|{self.temperature}|{self.max_tokens}|{prompt}"
+        if batched:
+            # Single-prompt keys stay as before, so existing entries remain valid
+            material = f"batch|{material}"
+        key = hashlib.sha256(material.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _read_cached(self, cache_path: Optional[Path]) -> Optional[Dict[str, Any]]:
+        """Read a cached summary.
+
+        Args:
+            cache_path: Path to cache file
+
+        Returns:
+            Summary dictionary or None on miss
+        """
+        if cache_path is None or not cache_path.exists():
+            return None
+
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are an expert research assistant specializing in LLM and AI research. "
-                            "Provide detailed, insightful paper summaries in JSON format."
-                        )
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                response_format={"type": "json_object"}
-            )
+            return orjson.loads(cache_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Error reading summary cache: {e}")
+            return None
 
-            summary = json.loads(response.choices[0].message.content)
-            return summary
+    def _write_cached(self, cache_path: Optional[Path], summary: Dict[str, Any]) -> None:
+        """Write a summary to the cache atomically.
 
-        except Exception as e:
-            logger.error(f"LLM API error: {e}")
-            return self._create_fallback_summary(paper)
+        Args:
+            cache_path: Path to cache file
+            summary: Summary dictionary
+        """
+        if cache_path is None:
+            return
+
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            tmp_path.write_bytes(orjson.dumps(summary))
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Error writing summary cache: {e}")
 
     def _build_summary_prompt(self, paper: Paper, content: str) -> str:
         """Build summarization prompt.
@@ -162,6 +425,100 @@ Respond in JSON format:
 }}
 """
 
+    def _build_batch_prompt(self, papers: List[Paper]) -> str:
+        """Build summarization prompt for several abstract-only papers.
+
+        Args:
+            papers: Papers to summarize
+
+        Returns:
+            Prompt string
+        """
+        blocks = [
+            f"""## Paper {i}
+
+**ID:** {paper.short_id}
+
+**Title:** {paper.title}
+
+**Authors:** {paper.authors_str}
+
+**Published:** {paper.published_str}
+
+**Categories:** {', '.join(paper.categories)}
+
+**Abstract:**
+{paper.abstract}
+"""
+            for i, paper in enumerate(papers, 1)
+        ]
+        papers_text = "\n".join(blocks)
+
+        return f"""# My Research Interests
+{self.research_profile}
+
+---
+
+# Papers to Summarize
+
+{papers_text}
+---
+
+# Task
+
+For every paper above, provide a detailed, technical summary that helps me quickly understand:
+
+1. **Key Contributions** (3-5 bullet points): Main innovations and findings
+2. **Methodology**: How did they achieve their results?
+3. **Results & Performance**: Key numbers, benchmarks, improvements
+4. **Relevance to My Research**: Why this matters to me specifically (given my research interests)
+5. **Limitations**: Any caveats or weaknesses mentioned
+6. **Future Work**: What's next according to the authors
+
+**IMPORTANT:**
+- Be specific and technical, not vague or generic
+- Include numbers, metrics, and concrete details
+- Focus on novelty and practical implications
+- Keep it concise but comprehensive
+
+Respond in JSON format, with one entry per paper using its ID:
+{{
+  "summaries": [
+    {{
+      "id": "2401.12345",
+      "key_points": ["Point 1", "Point 2", ...],
+      "methodology": "Description...",
+      "results": "Key results...",
+      "relevance_reason": "Why relevant...",
+      "limitations": "Limitations...",
+      "future_work": "Future directions..."
+    }}
+  ]
+}}
+"""
+
+    def _parse_batch_response(self, content: str) -> Dict[str, Dict[str, Any]]:
+        """Parse the model's JSON response for a batched prompt.
+
+        Args:
+            content: Raw response content
+
+        Returns:
+            Dictionary mapping paper ID to summary dictionary
+        """
+        results = {}
+        for item in orjson.loads(content).get('summaries', []):
+            if not isinstance(item, dict) or not isinstance(item.get('key_points'), list):
+                logger.debug("Skipping malformed batched summary")
+                continue
+
+            summary = dict(item)
+            paper_id = str(summary.pop('id', ''))
+            if paper_id:
+                results[paper_id] = summary
+
+        return results
+
     def _create_fallback_summary(self, paper: Paper) -> Dict[str, Any]:
         """Create basic summary when LLM fails.
 
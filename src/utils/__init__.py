@@ -1,5 +1,5 @@
 """Utility modules."""
 
-from .logger import setup_logger, get_logger
+from .logger import setup_logger, get_logger, stop_logger
 
-__all__ = ['setup_logger', 'get_logger']
+__all__ = ['setup_logger', 'get_logger', 'stop_logger']
@@ -1,41 +1,126 @@
-"""Simple file-based caching utilities."""
+"""Simple persistent caching utilities."""
 
-import json
+import functools
 import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Any, Optional, Callable
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Callable
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Bytes of the database file SQLite may memory-map
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Keys per query, well below SQLite's bound-parameter limit
+MAX_KEYS_PER_QUERY = 500
+
+# Leftover files deleted in parallel once there are this many
+UNLINK_PARALLEL_THRESHOLD = 64
+UNLINK_WORKERS = 16
+
+
+@functools.lru_cache(maxsize=4096)
+def _hash_key(key: str, hash_algo: str) -> bytes:
+    """Hash a cache key, memoized for keys looked up repeatedly.
+
+    Args:
+        key: Cache key
+        hash_algo: "blake2b" or "md5"
+
+    Returns:
+        16-byte digest of the key
+    """
+    if hash_algo == "md5":
+        return hashlib.md5(key.encode()).digest()
+    # Faster than MD5 on 64-bit CPUs; no security requirement here
+    return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
 
 class Cache:
-    """Simple file-based cache for paper data."""
+    """Simple key-value cache for paper data.
 
-    def __init__(self, cache_dir: str = "data/cache", ttl_days: int = 7):
+    All entries live in one SQLite database (``cache.db`` in the cache
+    directory) in WAL mode, so a write is a sequential log append rather
+    than a new file, and expiry is a single indexed ``DELETE``.
+
+    Recently read values are also kept in memory, so repeated lookups of
+    a key within a run do not touch the database. Values from memory are
+    shared between callers and should not be mutated. Misses are not
+    remembered: another instance may write the key at any time.
+
+    One instance may be shared between threads: the connection and the
+    in-memory stores are guarded by a single lock.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = "data/cache",
+        ttl_days: int = 7,
+        memory_size: int = 1024,
+        hash_algo: str = "blake2b"
+    ):
         """Initialize cache.
 
         Args:
-            cache_dir: Directory to store cache files
+            cache_dir: Directory to store the cache database
             ttl_days: Time-to-live in days
+            memory_size: Number of entries kept in memory (LRU)
+            hash_algo: Key hash, "blake2b" or "md5" (databases written
+                before the switch)
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = timedelta(days=ttl_days)
 
-    def _get_cache_path(self, key: str) -> Path:
-        """Get cache file path for a key.
+        if hash_algo not in ("blake2b", "md5"):
+            raise ValueError(f"Unsupported cache hash algorithm: {hash_algo}")
+        self.hash_algo = hash_algo
+
+        # key -> (timestamp, value), most recently used last
+        self._mem = OrderedDict()
+        self._mem_max = memory_size
+
+        # Autocommit: every statement is its own transaction. Worker threads
+        # share the connection, serialized by self._lock.
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(
+            str(self.cache_dir / "cache.db"),
+            isolation_level=None,
+            check_same_thread=False
+        )
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        # Read database pages through a memory map instead of read() copies
+        self.conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "k BLOB PRIMARY KEY, "
+            "ts REAL NOT NULL, "
+            "v BLOB NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS entries_ts ON entries(ts)")
+
+    def _get_key_hash(self, key: str) -> bytes:
+        """Get the stored form of a key.
 
         Args:
             key: Cache key
 
         Returns:
-            Path to cache file
+            16-byte digest of the key
         """
-        # Hash the key to create a safe filename
-        key_hash = hashlib.md5(key.encode()).hexdigest()
-        return self.cache_dir / f"{key_hash}.json"
+        return _hash_key(key, self.hash_algo)
 
     def get(self, key: str) -> Optional[Any]:
         """Get cached value.
@@ -46,50 +131,188 @@ class Cache:
         Returns:
             Cached value or None if not found/expired
         """
-        cache_file = self._get_cache_path(key)
-
-        if not cache_file.exists():
-            return None
+        now = time.time()
+
+        with self._lock:
+            entry = self._mem.get(key)
+            if entry is not None:
+                cached_time, value = entry
+                if now - cached_time <= self.ttl.total_seconds():
+                    self._mem.move_to_end(key)
+                    return value
+                del self._mem[key]
+
+            key_hash = self._get_key_hash(key)
+            row = self.conn.execute(
+                "SELECT ts, v FROM entries WHERE k = ?", (key_hash,)
+            ).fetchone()
+
+            if row is None:
+                return None
 
-        try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            cached_time, blob = row
 
             # Check if expired
-            cached_time = datetime.fromisoformat(data['timestamp'])
-            if datetime.now() - cached_time > self.ttl:
-                logger.debug(f"Cache expired for key: {key}")
-                cache_file.unlink()  # Delete expired cache
+            if now - cached_time > self.ttl.total_seconds():
+                logger.debug("Cache expired for key: %s", key)
+                self.conn.execute("DELETE FROM entries WHERE k = ?", (key_hash,))
+                return None
+
+            try:
+                value = orjson.loads(blob)
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"Error reading cache: {e}")
                 return None
 
-            logger.debug(f"Cache hit for key: {key}")
-            return data['value']
+            self._remember(self._mem, key, (cached_time, value))
+            logger.debug("Cache hit for key: %s", key)
+            return value
 
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            logger.warning(f"Error reading cache: {e}")
-            return None
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several cached values with one database query.
 
-    def set(self, key: str, value: Any) -> None:
-        """Set cached value.
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dictionary mapping each key found (and not expired) to its value
+        """
+        now = time.time()
+        ttl = self.ttl.total_seconds()
+        found = {}
+
+        with self._lock:
+            # Answer what we can from memory, query the rest by key hash
+            pending = {}
+            for key in keys:
+                entry = self._mem.get(key)
+                if entry is not None and now - entry[0] <= ttl:
+                    self._mem.move_to_end(key)
+                    found[key] = entry[1]
+                    continue
+                pending[self._get_key_hash(key)] = key
+
+            hashes = list(pending)
+            expired = []
+            for start in range(0, len(hashes), MAX_KEYS_PER_QUERY):
+                chunk = hashes[start:start + MAX_KEYS_PER_QUERY]
+                rows = self.conn.execute(
+                    f"SELECT k, ts, v FROM entries WHERE k IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+
+                for key_hash, cached_time, blob in rows:
+                    key = pending.pop(key_hash)
+                    if now - cached_time > ttl:
+                        expired.append((key_hash,))
+                        continue
+                    try:
+                        value = orjson.loads(blob)
+                    except orjson.JSONDecodeError as e:
+                        logger.warning(f"Error reading cache: {e}")
+                        continue
+                    self._remember(self._mem, key, (cached_time, value))
+                    found[key] = value
+
+            if expired:
+                self.conn.executemany("DELETE FROM entries WHERE k = ?", expired)
+
+        logger.debug("Cache hits: %d/%d", len(found), len(keys))
+        return found
+
+    def _remember(self, store: OrderedDict, key: str, item: Any) -> None:
+        """Add an item to an in-memory store, evicting the oldest beyond capacity.
+
+        Must be called with ``self._lock`` held.
+
+        Args:
+            store: ``self._mem``
+            key: Cache key
+            item: Item to store
+        """
+        store[key] = item
+        store.move_to_end(key)
+        if len(store) > self._mem_max:
+            store.popitem(last=False)
+
+    def _forget(self, key: str) -> None:
+        """Drop a key from the in-memory store.
+
+        Must be called with ``self._lock`` held.
 
         Args:
             key: Cache key
-            value: Value to cache (must be JSON serializable)
         """
-        cache_file = self._get_cache_path(key)
+        self._mem.pop(key, None)
 
-        data = {
-            'timestamp': datetime.now().isoformat(),
-            'key': key,
-            'value': value
-        }
+    def _encode(self, value: Any) -> Optional[bytes]:
+        """Serialize a value for storage.
 
+        Args:
+            value: Value to cache
+
+        Returns:
+            Encoded value, or None if it is not JSON serializable
+        """
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            logger.debug(f"Cached value for key: {key}")
+            return orjson.dumps(
+                value,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
         except (TypeError, ValueError) as e:
             logger.error(f"Error caching value: {e}")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Set cached value.
+
+        Args:
+            key: Cache key
+            value: Value to cache (must be JSON serializable)
+        """
+        blob = self._encode(value)
+        if blob is None:
+            return
+
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries (k, ts, v) VALUES (?, ?, ?)",
+                (self._get_key_hash(key), time.time(), blob)
+            )
+            # Re-read from the database next time, so values always come
+            # back exactly as stored (e.g. tuples as lists)
+            self._forget(key)
+        logger.debug("Cached value for key: %s", key)
+
+    def set_many(self, mapping: Dict[str, Any]) -> None:
+        """Set several cached values in one transaction.
+
+        Args:
+            mapping: Dictionary of cache key to value (values must be JSON
+                serializable; others are skipped)
+        """
+        now = time.time()
+        rows = []
+        for key, value in mapping.items():
+            blob = self._encode(value)
+            if blob is not None:
+                rows.append((self._get_key_hash(key), now, blob))
+
+        with self._lock:
+            for key in mapping:
+                self._forget(key)
+
+            if not rows:
+                return
+
+            # One commit (and WAL sync) for the whole batch
+            with self.conn:
+                self.conn.execute("BEGIN")
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO entries (k, ts, v) VALUES (?, ?, ?)",
+                    rows
+                )
+        logger.debug("Cached %d values", len(rows))
 
     def delete(self, key: str) -> None:
         """Delete cached value.
@@ -97,52 +320,122 @@ class Cache:
         Args:
             key: Cache key
         """
-        cache_file = self._get_cache_path(key)
-        if cache_file.exists():
-            cache_file.unlink()
-            logger.debug(f"Deleted cache for key: {key}")
+        with self._lock:
+            self._forget(key)
+            cursor = self.conn.execute(
+                "DELETE FROM entries WHERE k = ?", (self._get_key_hash(key),)
+            )
+        if cursor.rowcount > 0:
+            logger.debug("Deleted cache for key: %s", key)
 
     def clear(self) -> int:
-        """Clear all cached files.
+        """Clear all cached entries.
 
         Returns:
-            Number of files deleted
+            Number of entries deleted
         """
-        count = 0
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink()
-            count += 1
+        with self._lock:
+            self._mem.clear()
+            count = self.conn.execute("DELETE FROM entries").rowcount
+        count += self._remove_legacy_files()
 
-        logger.info(f"Cleared {count} cache files")
+        logger.info(f"Cleared {count} cache entries")
         return count
 
     def clean_expired(self) -> int:
-        """Remove expired cache files.
+        """Remove expired cache entries.
 
         Returns:
-            Number of expired files deleted
+            Number of expired entries deleted
         """
-        count = 0
-        for cache_file in self.cache_dir.glob("*.json"):
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                cached_time = datetime.fromisoformat(data['timestamp'])
-                if datetime.now() - cached_time > self.ttl:
-                    cache_file.unlink()
-                    count += 1
-
-            except (json.JSONDecodeError, KeyError, ValueError):
-                # Delete corrupted cache files
-                cache_file.unlink()
-                count += 1
+        cutoff = time.time() - self.ttl.total_seconds()
+        # Expired entries in memory are dropped lazily by get()
+        with self._lock:
+            count = self.conn.execute(
+                "DELETE FROM entries WHERE ts < ?", (cutoff,)
+            ).rowcount
+        count += self._remove_legacy_files(cutoff)
 
         if count > 0:
-            logger.info(f"Cleaned {count} expired cache files")
+            logger.info(f"Cleaned {count} expired cache entries")
 
         return count
 
+    def _remove_legacy_files(self, cutoff: Optional[float] = None) -> int:
+        """Delete per-key JSON files left over from the old file-based layout.
+
+        Files are judged by modification time, which equals their write
+        time, so they are never opened.
+
+        Args:
+            cutoff: Only delete files modified before this Unix time
+                (None deletes all)
+
+        Returns:
+            Number of files deleted
+        """
+        paths = []
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json') or not entry.is_file():
+                    continue
+                if cutoff is not None and entry.stat().st_mtime >= cutoff:
+                    continue
+                paths.append(entry.path)
+
+        if len(paths) < UNLINK_PARALLEL_THRESHOLD:
+            return sum(map(_unlink, paths))
+
+        # unlink() is a metadata round trip each; overlap them
+        with ThreadPoolExecutor(max_workers=UNLINK_WORKERS) as executor:
+            return sum(executor.map(_unlink, paths))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+
+
+def _unlink(path: str) -> bool:
+    """Delete a file, tolerating concurrent removal.
+
+    Args:
+        path: File path
+
+    Returns:
+        True if this call deleted the file
+    """
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def _default_key(func: Callable, args: tuple, kwargs: dict) -> str:
+    """Build a cache key from a function and its arguments.
+
+    Args:
+        func: Cached function
+        args: Positional arguments
+        kwargs: Keyword arguments
+
+    Returns:
+        Hex digest identifying the call
+    """
+    try:
+        # Pickling is done in C and, with sorted kwargs, does not depend
+        # on keyword order
+        payload = pickle.dumps(
+            (func.__module__, func.__qualname__, args, tuple(sorted(kwargs.items()))),
+            protocol=5
+        )
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # Unpicklable arguments: fall back to their string form
+        payload = f"{func.__qualname__}_{str(args)}_{str(kwargs)}".encode()
+
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
 
 def cached(cache_instance: Cache, key_func: Optional[Callable] = None):
     """Decorator to cache function results.
@@ -159,13 +452,14 @@ def cached(cache_instance: Cache, key_func: Optional[Callable] = None):
         ...     return result
     """
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             # Generate cache key
             if key_func:
                 key = key_func(*args, **kwargs)
             else:
                 # Default: use function name and args
-                key = f"{func.__name__}_{str(args)}_{str(kwargs)}"
+                key = _default_key(func, args, kwargs)
 
             # Try to get from cache
             result = cache_instance.get(key)
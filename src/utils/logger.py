@@ -1,10 +1,12 @@
 """Logging utilities."""
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 
 def setup_logger(
@@ -17,6 +19,11 @@ def setup_logger(
 ) -> logging.Logger:
     """Set up logger with console and file handlers.
 
+    The handlers run on a background ``QueueListener`` thread; the logger
+    itself only enqueues records, so logging calls never wait on console
+    or disk writes. The listener is stopped (and the queue flushed) at
+    interpreter exit, or explicitly with ``stop_logger``.
+
     Args:
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
@@ -32,6 +39,7 @@ def setup_logger(
     logger.setLevel(getattr(logging, level.upper()))
 
     # Remove existing handlers
+    stop_logger(logger)
     logger.handlers.clear()
 
     # Define formats
@@ -52,7 +60,7 @@ def setup_logger(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (if log_file specified)
     if log_file:
@@ -67,11 +75,40 @@ def setup_logger(
         )
         file_handler.setLevel(logging.DEBUG)  # Log everything to file
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    logger._queue_listener = listener
 
     return logger
 
 
+def stop_logger(logger: logging.Logger) -> None:
+    """Flush pending records and stop the logger's background listener.
+
+    Args:
+        logger: Logger configured by ``setup_logger``
+    """
+    listener = getattr(logger, '_queue_listener', None)
+    if listener is not None:
+        logger._queue_listener = None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+@atexit.register
+def _stop_all() -> None:
+    """Stop every queue listener at interpreter exit."""
+    for logger in list(logging.Logger.manager.loggerDict.values()):
+        if isinstance(logger, logging.Logger):
+            stop_logger(logger)
+
+
 def get_logger(name: str = "llm_digest") -> logging.Logger:
     """Get existing logger by name.
 
@@ -0,0 +1,30 @@
+"""Shared OpenAI client construction."""
+
+from functools import lru_cache
+
+from openai import OpenAI
+
+
+@lru_cache(maxsize=4)
+def get_openai_client(api_key: str) -> OpenAI:
+    """Get a process-wide OpenAI client for an API key.
+
+    All components share one HTTP/2 connection pool, so consecutive and
+    concurrent requests reuse warm TLS connections.
+
+    Args:
+        api_key: OpenAI API key
+
+    Returns:
+        OpenAI client
+    """
+    import httpx
+
+    return OpenAI(
+        api_key=api_key,
+        http_client=httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+            timeout=httpx.Timeout(60.0)
+        )
+    )
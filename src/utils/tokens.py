@@ -0,0 +1,73 @@
+"""Token counting helpers for LLM prompts."""
+
+import logging
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str) -> Optional[tiktoken.Encoding]:
+    """Get the tokenizer for a model, loaded once per process.
+
+    Args:
+        model: Model name (e.g., 'gpt-4o-mini')
+
+    Returns:
+        tiktoken Encoding, or None if it could not be loaded
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Unknown or custom model
+            return tiktoken.get_encoding('cl100k_base')
+    except Exception as e:
+        # BPE tables are downloaded on first use and may be unreachable
+        logger.warning(f"Tokenizer unavailable for {model}, estimating tokens: {e}")
+        return None
+
+
+def count_tokens(text: str, model: str) -> int:
+    """Count tokens in text for a model.
+
+    Args:
+        text: Text to count
+        model: Model name
+
+    Returns:
+        Token count (approximated as len/4 if no tokenizer is available)
+    """
+    encoding = get_encoding(model)
+    if encoding is None:
+        # ~4 characters per token for English text
+        return len(text) // 4
+    # Papers quote strings like '<|endoftext|>'; count them as plain text
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, model: str, max_tokens: int) -> Tuple[str, bool]:
+    """Cut text down to at most ``max_tokens`` tokens for a model.
+
+    Args:
+        text: Text to truncate
+        model: Model name
+        max_tokens: Token budget
+
+    Returns:
+        Tuple of (possibly shortened text, whether it was truncated)
+    """
+    encoding = get_encoding(model)
+    if encoding is None:
+        max_chars = max_tokens * 4
+        if len(text) <= max_chars:
+            return text, False
+        return text[:max_chars], True
+
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text, False
+    return encoding.decode(tokens[:max_tokens]), True
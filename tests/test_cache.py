@@ -0,0 +1,65 @@
+"""Tests for the SQLite-backed key-value cache."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.cache import Cache
+
+
+def test_set_and_get(tmp_path):
+    cache = Cache(str(tmp_path))
+
+    cache.set("key", {"data": [1, 2]})
+
+    assert cache.get("key") == {"data": [1, 2]}
+    assert cache.get("missing") is None
+
+
+def test_cache_expiry(tmp_path, monkeypatch):
+    cache = Cache(str(tmp_path), ttl_days=1)
+    cache.set("old", "value")
+    cache.set("older", "value")
+    # Warm the in-memory store too, so both tiers must honour the TTL
+    assert cache.get("old") == "value"
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + cache.ttl.total_seconds() + 1)
+
+    assert cache.get("old") is None
+    assert cache.get_many(["old", "older"]) == {}
+    assert cache.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 0
+
+
+def test_shared_across_threads(tmp_path):
+    cache = Cache(str(tmp_path), memory_size=16)
+
+    def work(i):
+        key = f"key{i % 50}"
+        cache.set(key, i)
+        cache.get(key)
+        cache.get_many([key, f"key{(i + 1) % 50}"])
+        if i % 7 == 0:
+            cache.delete(key)
+        if i % 25 == 0:
+            cache.set_many({f"batch{i}": i, f"batch{i + 1}": i + 1})
+        return i
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert sorted(executor.map(work, range(400))) == list(range(400))
+
+    cache.set("after", "value")
+    assert cache.get("after") == "value"
+    assert cache.get("batch25") == 25
+
+
+def test_miss_sees_later_write_from_other_instance(tmp_path):
+    reader = Cache(str(tmp_path))
+    writer = Cache(str(tmp_path))
+
+    assert reader.get("q") is None
+    assert reader.get_many(["q"]) == {}
+
+    writer.set("q", 5)
+
+    assert reader.get("q") == 5
+    assert reader.get_many(["q"]) == {"q": 5}
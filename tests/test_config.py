@@ -0,0 +1,49 @@
+"""Tests for configuration loading and lookup."""
+
+import pytest
+import yaml
+
+from src.config import Config
+
+
+@pytest.fixture
+def config(tmp_path):
+    profile = tmp_path / "profile.md"
+    profile.write_text("LLM agents", encoding="utf-8")
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump({
+        'research_profile': {'profile_file': str(profile)},
+        'llm': {'provider': 'openai', 'model': 'gpt-4o-mini'},
+        'email': {'smtp_server': 'smtp.example.com', 'sender_email': 'a@example.com'},
+        'directories': {'cache': str(tmp_path / "cache")},
+    }), encoding="utf-8")
+    return Config(str(path))
+
+
+def test_get_paths_and_defaults(config):
+    assert config.get('llm.model') == 'gpt-4o-mini'
+    assert config.get('llm') == {'provider': 'openai', 'model': 'gpt-4o-mini'}
+    assert config.get('llm.missing', 'fallback') == 'fallback'
+    assert config.get('llm.model.deeper') is None
+
+
+def test_set_updates_existing_and_new_keys(config):
+    config.set('llm.model', 'gpt-4o')
+    config.set('cache.relevance.semantic', False)
+
+    assert config.get('llm.model') == 'gpt-4o'
+    assert config.get('llm')['model'] == 'gpt-4o'
+    assert config.get('cache.relevance.semantic') is False
+
+
+def test_assigning_config_rebuilds_index(config):
+    config.config = {'llm': {'model': 'other'}}
+
+    assert config.get('llm.model') == 'other'
+    assert config.get('email.smtp_server') is None
+
+
+def test_in_place_addition_is_found(config):
+    config.config['sources'] = {'arxiv': {'enabled': True}}
+
+    assert config.get('sources.arxiv.enabled') is True
@@ -0,0 +1,87 @@
+"""Tests for LLM paper summarization."""
+
+from datetime import datetime
+
+import orjson
+import pytest
+
+from src.fetchers.base import Paper
+from src.summarizers import llm_summarizer
+from src.summarizers.llm_summarizer import LLMSummarizer
+
+
+class StubConfig:
+    """Minimal stand-in for Config."""
+
+    def __init__(self, cache_dir):
+        self.settings = {'directories.llm_cache': str(cache_dir)}
+        self.llm_config = {
+            'provider': 'openai',
+            'model': 'gpt-4o-mini',
+            'api_key': 'test-key',
+            'temperature': 0.0,
+            'max_tokens': 500,
+        }
+        self.research_profile = "Large language models"
+
+    def get(self, key, default=None):
+        return self.settings.get(key, default)
+
+
+class FakeCompletions:
+    """Answers batched prompts with a batch summary and others with a single one."""
+
+    def __init__(self):
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        prompt = kwargs['messages'][-1]['content']
+        if '2401.00001' in prompt and '2401.00002' in prompt:
+            content = {'summaries': [
+                {'id': '2401.00001', 'key_points': ['batch']},
+                {'id': '2401.00002', 'key_points': ['batch']},
+            ]}
+        else:
+            content = {'key_points': ['single']}
+        message = type("Message", (), {"content": orjson.dumps(content).decode()})
+        choice = type("Choice", (), {"message": message})
+        return type("Response", (), {"choices": [choice]})
+
+
+@pytest.fixture
+def client(monkeypatch):
+    completions = FakeCompletions()
+    fake = type("Client", (), {})()
+    fake.chat = type("Chat", (), {"completions": completions})()
+    monkeypatch.setattr(llm_summarizer, 'get_openai_client', lambda api_key: fake)
+    return completions
+
+
+def make_paper(n):
+    return Paper(
+        title=f"Paper {n}",
+        authors=["A. Author"],
+        abstract="About language models.",
+        pdf_url=f"https://arxiv.org/pdf/2401.0000{n}",
+        arxiv_id=f"2401.0000{n}v1",
+        published=datetime(2024, 1, 1),
+        categories=["cs.CL"],
+    )
+
+
+def test_batch_summaries_are_not_served_to_single_calls(tmp_path, client):
+    summarizer = LLMSummarizer(StubConfig(tmp_path))
+    papers = [make_paper(1), make_paper(2)]
+
+    batch = summarizer.summarize_chunk(papers)
+    assert [s['key_points'] for s in batch] == [['batch'], ['batch']]
+    assert len(client.calls) == 1
+
+    # Cached batch answers are reused by batches...
+    assert summarizer.summarize_chunk(papers) == batch
+    assert len(client.calls) == 1
+
+    # ...but a single-paper call asks the single prompt
+    assert summarizer.summarize_single(papers[0])['key_points'] == ['single']
+    assert len(client.calls) == 2
@@ -0,0 +1,42 @@
+"""Tests for the Paper data class."""
+
+from datetime import datetime
+
+from src.fetchers.base import Paper
+
+
+def make_paper(**kwargs):
+    return Paper(
+        title="Title",
+        authors=["A", "B", "C"],
+        abstract="Abstract",
+        pdf_url="https://arxiv.org/pdf/2401.12345v2",
+        arxiv_id="2401.12345v2",
+        published=datetime(2024, 1, 15),
+        categories=["cs.CL"],
+        **kwargs
+    )
+
+
+def test_relevance_follows_assigned_score():
+    paper = make_paper()
+    assert paper.relevance_bucket == 'medium'
+    assert paper.relevance_percent == 50
+
+    paper.relevance_score = 0.9
+    assert paper.relevance_bucket == 'high'
+    assert paper.relevance_percent == 90
+
+    paper.relevance_score = 0.2
+    assert paper.relevance_bucket == 'low'
+    assert paper.relevance_percent == 20
+
+
+def test_derived_display_values():
+    paper = make_paper(relevance_score=0.85)
+
+    assert paper.short_id == "2401.12345"
+    assert paper.arxiv_url == "https://arxiv.org/abs/2401.12345"
+    assert paper.authors_str == "A et al."
+    assert paper.published_str == "Jan 15, 2024"
+    assert paper.relevance_bucket == 'high'
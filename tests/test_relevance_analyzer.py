@@ -0,0 +1,128 @@
+"""Tests for LLM relevance analysis."""
+
+import asyncio
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.analyzers import relevance_analyzer
+from src.analyzers.relevance_analyzer import RelevanceAnalyzer
+from src.fetchers.base import Paper
+
+
+class StubConfig:
+    """Minimal stand-in for Config."""
+
+    def __init__(self, cache_dir):
+        self.settings = {
+            'directories.cache': str(cache_dir),
+            'llm.prefilter': False,
+        }
+        self.llm_config = {
+            'provider': 'openai',
+            'model': 'gpt-4o-mini',
+            'api_key': 'test-key',
+            'temperature': 0.0,
+        }
+        self.research_profile = "Large language models"
+        self.profile_hash = "profile-hash"
+
+    def get(self, key, default=None):
+        return self.settings.get(key, default)
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    monkeypatch.setattr(relevance_analyzer, 'get_openai_client', lambda api_key: object())
+    return RelevanceAnalyzer(StubConfig(tmp_path))
+
+
+@pytest.fixture
+def paper():
+    return Paper(
+        title="A paper",
+        authors=["A. Author"],
+        abstract="About language models.",
+        pdf_url="https://arxiv.org/pdf/2401.00001",
+        arxiv_id="2401.00001v1",
+        published=datetime(2024, 1, 1),
+        categories=["cs.CL"],
+    )
+
+
+def test_semantic_cache_failure_is_a_miss(analyzer, paper):
+    def broken(profile, embedding):
+        raise ValueError("shapes not aligned")
+
+    analyzer.cache.get_similar = broken
+    embedding = np.ones(8, dtype=np.float32) / np.sqrt(8)
+
+    key, returned, cached = asyncio.run(
+        analyzer._lookup_cached(paper, embedding=embedding)
+    )
+
+    assert cached is None
+    assert returned is embedding
+
+
+class FakeCompletions:
+    """Records requests and answers with a fixed relevance score."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        message = type("Message", (), {"content": '{"score": 0.8, "reason": "on topic"}'})
+        choice = type("Choice", (), {"message": message})
+        return type("Response", (), {"choices": [choice]})
+
+
+class FakeAsyncClient:
+    def __init__(self):
+        self.chat = type("Chat", (), {"completions": FakeCompletions()})()
+
+
+def test_analyze_single_async_with_explicit_client(analyzer, paper):
+    client = FakeAsyncClient()
+
+    score, reason = asyncio.run(analyzer.analyze_single_async(paper, client))
+
+    assert (score, reason) == (0.8, "on topic")
+    assert len(client.chat.completions.calls) == 1
+
+
+def test_analyze_single_async_opens_its_own_client(analyzer, paper, monkeypatch):
+    client = FakeAsyncClient()
+
+    class FakeAsyncOpenAI:
+        def __init__(self, api_key):
+            assert api_key == 'test-key'
+
+        async def __aenter__(self):
+            return client
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+    monkeypatch.setattr(relevance_analyzer, 'AsyncOpenAI', FakeAsyncOpenAI)
+
+    assert asyncio.run(analyzer.analyze_single_async(paper)) == (0.8, "on topic")
+    assert len(client.chat.completions.calls) == 1
+
+
+def test_semantic_cache_disabled_skips_similarity_lookup(analyzer, paper):
+    analyzer.semantic_cache = False
+
+    calls = []
+    analyzer.cache.get_similar = lambda profile, embedding: calls.append(profile)
+    embedding = np.ones(8, dtype=np.float32) / np.sqrt(8)
+
+    _, returned, cached = asyncio.run(
+        analyzer._lookup_cached(paper, embedding=embedding)
+    )
+
+    assert calls == []
+    assert cached is None
+    assert returned is embedding
@@ -0,0 +1,68 @@
+"""Tests for the persistent relevance score cache."""
+
+import sqlite3
+
+import numpy as np
+
+from src.analyzers.relevance_cache import RelevanceCache
+
+
+def unit(values):
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def test_semantic_hit_for_same_models(tmp_path):
+    cache = RelevanceCache(tmp_path / "relevance.db", model="m", embedding_model="e")
+    embedding = unit(np.arange(1, 9))
+
+    cache.put("a", "profile", 0.9, "close", embedding)
+
+    assert cache.get_similar("profile", embedding) == (0.9, "close")
+
+
+def test_dimension_change_is_a_miss(tmp_path):
+    db_path = tmp_path / "relevance.db"
+    RelevanceCache(db_path, model="m", embedding_model="small").put(
+        "a", "profile", 0.9, "close", unit(np.arange(1, 9))
+    )
+
+    cache = RelevanceCache(db_path, model="m", embedding_model="small")
+    wider = unit(np.arange(1, 17))
+
+    assert cache.get_similar("profile", wider) is None
+    cache.put("b", "profile", 0.4, "far", wider)
+    assert cache.get_similar("profile", wider) == (0.4, "far")
+
+
+def test_other_embedding_model_is_a_miss(tmp_path):
+    db_path = tmp_path / "relevance.db"
+    embedding = unit(np.arange(1, 9))
+    RelevanceCache(db_path, model="m", embedding_model="old").put(
+        "a", "profile", 0.9, "close", embedding
+    )
+
+    cache = RelevanceCache(db_path, model="m", embedding_model="new")
+
+    assert cache.get_similar("profile", embedding) is None
+    assert cache.get("a") == (0.9, "close")
+
+
+def test_upgrades_untagged_database(tmp_path):
+    db_path = tmp_path / "relevance.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE relevance (key TEXT PRIMARY KEY, profile TEXT NOT NULL, "
+        "score REAL NOT NULL, reason TEXT, embedding BLOB, last_used REAL NOT NULL)"
+    )
+    conn.execute(
+        "INSERT INTO relevance VALUES ('a', 'profile', 0.9, 'old', ?, 0)",
+        (unit(np.arange(1, 9)).tobytes(),)
+    )
+    conn.commit()
+    conn.close()
+
+    cache = RelevanceCache(db_path, model="m", embedding_model="e")
+
+    assert cache.get("a") == (0.9, "old")
+    assert cache.get_similar("profile", unit(np.arange(1, 9))) is None
@@ -0,0 +1,34 @@
+"""Tests for token counting helpers."""
+
+import pytest
+import tiktoken
+
+from src.utils import tokens
+
+
+@pytest.fixture
+def byte_encoding(monkeypatch):
+    """Byte-level encoding with one special token, built without a download."""
+    encoding = tiktoken.Encoding(
+        name="bytes",
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={"<|endoftext|>": 256},
+    )
+    monkeypatch.setattr(tokens, 'get_encoding', lambda model: encoding)
+    return encoding
+
+
+def test_count_tokens_with_special_token_text(byte_encoding):
+    text = "Models emit <|endoftext|> at the end."
+
+    assert tokens.count_tokens(text, "gpt-4o-mini") == len(text.encode())
+
+
+def test_truncate_tokens_with_special_token_text(byte_encoding):
+    text = "<|endoftext|>" * 10
+
+    truncated, was_truncated = tokens.truncate_tokens(text, "gpt-4o-mini", 13)
+
+    assert was_truncated
+    assert truncated == "<|endoftext|>"